@@ -24,7 +24,9 @@ const SHEETS = {
   CHEM_MANUAL_SHADOW: 'Chem Style Manual Entry - Shadow',
   CHEM_ARCHIVE: 'Chem Style Historic Archive',
   CHEM_DASHBOARD: 'Chem Style Analysis',
-  CHEM_BLACKLIST: 'Chem Style Blacklist'
+  CHEM_BLACKLIST: 'Chem Style Blacklist',
+  ROLLUP: 'Historic Daily Rollup',
+  DASHBOARD_MODES: 'Dashboard Modes'
 };
 
 const COLUMN_HEADERS = [
@@ -42,6 +44,46 @@ const CHEM_COLUMN_HEADERS = [
   'Full Blacklist', 'Hunter Skip', 'Shadow Skip'
 ];
 
+const DASHBOARD_MODES = ['normal', 'crash', 'rise', 'investments'];
+
+const MODE_TARGET_HEADERS = ['Player Name & Rating', 'Version'].concat(
+  ...DASHBOARD_MODES.map(mode => {
+    const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
+    return [`${modeText} Target Buy`, `${modeText} Target Sell (List)`, `${modeText} Net Profit %`];
+  })
+);
+
+const ROLLUP_HEADERS = [
+  'Day', 'Player Name & Rating', 'Version', "Min Today's Low", 'Max High (24H)', 'Current Price Sum', 'Current Price Count',
+  "First Today's Lows"
+];
+
+// Avg 3D falls back to the mean of this many most recent lows when no current
+// prices were logged in the last three days
+const AVG_3D_FALLBACK_LOWS = 3;
+
+// All day-window maths runs on integer epoch days in this timezone
+const UK_TIMEZONE = 'Europe/London';
+const MS_PER_DAY = 24 * 60 * 60 * 1000;
+
+// Archive rows older than this many days are moved out to monthly cold sheets
+const ANALYSIS_HORIZON_DAYS = 14;
+const ARCHIVE_BLOCK_ROWS = 5000;
+
+// Last day of Historic Archive rows moved to cold sheets while still inside the
+// horizon; the daily rollup is the only full record of days up to it
+const ARCHIVE_ROLLED_THROUGH_PROPERTY = 'ARCHIVE_ROLLED_THROUGH_DAY';
+
+// Archive columns stored as numbers on ingest (integer coins / float percent units)
+const ARCHIVE_PRICE_COLUMNS = [3, 4, 6, 7, 8, 9, 10];
+const ARCHIVE_PERCENT_COLUMNS = [11];
+const CHEM_ARCHIVE_PRICE_COLUMNS = [5, 6, 7, 8, 9];
+const CHEM_ARCHIVE_PERCENT_COLUMNS = [4];
+
+// When true, the original text of normalized cells is kept as JSON in a column
+// just past MAX_COLS, where getSheetData never reads it
+const KEEP_RAW_ARCHIVE_TEXT = false;
+
 const DEFAULT_VISIBLE_COLUMNS = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19];
 
 const MAX_ROWS = {
@@ -54,7 +96,9 @@ const MAX_ROWS = {
   'Chem Style Manual Entry - Shadow': 700,
   'Chem Style Historic Archive': 10000,
   'Chem Style Analysis': 700,
-  'Chem Style Blacklist': 1000
+  'Chem Style Blacklist': 1000,
+  'Historic Daily Rollup': 10000,
+  'Dashboard Modes': 350
 };
 
 const MAX_COLS = {
@@ -67,7 +111,9 @@ const MAX_COLS = {
   'Chem Style Manual Entry - Shadow': 8,
   'Chem Style Historic Archive': 10,
   'Chem Style Analysis': 12,
-  'Chem Style Blacklist': 13
+  'Chem Style Blacklist': 13,
+  'Historic Daily Rollup': 8,
+  'Dashboard Modes': 14
 };
 
 // ========================================
@@ -90,21 +136,123 @@ function parsePrice(value) {
   return isNaN(parsed) ? 0 : parsed;
 }
 
+function parsePercent(value) {
+  if (typeof value === 'number') return value;
+  if (!value) return NaN;
+  return parseFloat(String(value).replace('%', '').replace(/,/g, '').trim());
+}
+
+function normalizePriceCell(value) {
+  if (typeof value === 'number') return value;
+  if (value === '' || value === null || value === undefined) return '';
+  if (!/\d/.test(String(value))) return value;
+  return parsePrice(value);
+}
+
+function normalizePercentCell(value) {
+  if (typeof value === 'number') return value;
+  if (value === '' || value === null || value === undefined) return '';
+  const pct = parsePercent(value);
+  return isNaN(pct) ? value : pct;
+}
+
+// Returns a copy of row with the given columns converted to numbers. If rawWidth
+// is set, the row is padded to that width and the replaced text is appended as JSON.
+function normalizeArchiveRow(row, priceColumns, percentColumns, rawWidth) {
+  const normalized = row.slice();
+  const raw = {};
+  let hasRaw = false;
+  for (let i = 0; i < priceColumns.length; i++) {
+    const col = priceColumns[i];
+    if (col >= normalized.length) continue;
+    const value = normalizePriceCell(normalized[col]);
+    if (value !== normalized[col] && typeof normalized[col] === 'string') {
+      raw[col] = normalized[col];
+      hasRaw = true;
+    }
+    normalized[col] = value;
+  }
+  for (let i = 0; i < percentColumns.length; i++) {
+    const col = percentColumns[i];
+    if (col >= normalized.length) continue;
+    const value = normalizePercentCell(normalized[col]);
+    if (value !== normalized[col] && typeof normalized[col] === 'string') {
+      raw[col] = normalized[col];
+      hasRaw = true;
+    }
+    normalized[col] = value;
+  }
+  if (rawWidth) {
+    while (normalized.length < rawWidth) normalized.push('');
+    normalized.push(hasRaw ? JSON.stringify(raw) : '');
+  }
+  return normalized;
+}
+
 function parseDate(dateStr) {
   if (dateStr instanceof Date) return dateStr;
   if (!dateStr) return null;
   const str = String(dateStr).trim();
-  const ddmmyyyyMatch = str.match(/^(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})$/);
+  // Also accepts the "dd/mm/yyyy HH:MM:SS" stamps written by formatDateTime
+  const ddmmyyyyMatch = str.match(/^(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})(?:[ T](\d{1,2}):(\d{2})(?::(\d{2}))?)?$/);
   if (ddmmyyyyMatch) {
     const day = parseInt(ddmmyyyyMatch[1], 10);
     const month = parseInt(ddmmyyyyMatch[2], 10) - 1;
     const year = parseInt(ddmmyyyyMatch[3], 10);
-    return new Date(year, month, day);
+    const hours = ddmmyyyyMatch[4] ? parseInt(ddmmyyyyMatch[4], 10) : 0;
+    const minutes = ddmmyyyyMatch[5] ? parseInt(ddmmyyyyMatch[5], 10) : 0;
+    const seconds = ddmmyyyyMatch[6] ? parseInt(ddmmyyyyMatch[6], 10) : 0;
+    return new Date(year, month, day, hours, minutes, seconds);
   }
   const parsed = new Date(str);
   return isNaN(parsed.getTime()) ? null : parsed;
 }
 
+// Day number since 1970-01-01 of the UK calendar day a timestamp falls on.
+// Archive batches share one timestamp, so Date lookups are memoized per instant.
+const epochDayCache = new Map();
+
+function toEpochDay(value) {
+  if (!(value instanceof Date)) {
+    if (!value) return null;
+    const str = String(value).trim();
+    const ddmmyyyyMatch = str.match(/^(\d{1,2})[\/\-\.](\d{1,2})[\/\-\.](\d{4})(?:[ T]|$)/);
+    if (ddmmyyyyMatch) {
+      const day = parseInt(ddmmyyyyMatch[1], 10);
+      const month = parseInt(ddmmyyyyMatch[2], 10) - 1;
+      const year = parseInt(ddmmyyyyMatch[3], 10);
+      return Math.floor(Date.UTC(year, month, day) / MS_PER_DAY);
+    }
+    value = parseDate(str);
+    if (!value) return null;
+  }
+  const time = value.getTime();
+  if (isNaN(time)) return null;
+  let epochDay = epochDayCache.get(time);
+  if (epochDay === undefined) {
+    const parts = Utilities.formatDate(value, UK_TIMEZONE, 'yyyy-MM-dd').split('-');
+    epochDay = Math.floor(Date.UTC(parseInt(parts[0], 10), parseInt(parts[1], 10) - 1, parseInt(parts[2], 10)) / MS_PER_DAY);
+    epochDayCache.set(time, epochDay);
+  }
+  return epochDay;
+}
+
+function formatEpochDay(epochDay) {
+  const date = new Date(epochDay * MS_PER_DAY);
+  const day = String(date.getUTCDate()).padStart(2, '0');
+  const month = String(date.getUTCMonth() + 1).padStart(2, '0');
+  return `${day}/${month}/${date.getUTCFullYear()}`;
+}
+
+function getHistoryWindow(todayDay) {
+  return {
+    today: todayDay,
+    threeDaysAgo: todayDay - 3,
+    sevenDaysAgo: todayDay - 7,
+    fourteenDaysAgo: todayDay - 14
+  };
+}
+
 function formatDate(date) {
   if (!(date instanceof Date) || isNaN(date.getTime())) return '';
   const day = String(date.getDate()).padStart(2, '0');
@@ -113,15 +261,11 @@ function formatDate(date) {
   return `${day}/${month}/${year}`;
 }
 
+// Stamps are UK wall-clock time, the calendar toEpochDay reads them back in,
+// whatever timezone the script project is set to
 function formatDateTime(date) {
   if (!(date instanceof Date) || isNaN(date.getTime())) return '';
-  const day = String(date.getDate()).padStart(2, '0');
-  const month = String(date.getMonth() + 1).padStart(2, '0');
-  const year = date.getFullYear();
-  const hours = String(date.getHours()).padStart(2, '0');
-  const minutes = String(date.getMinutes()).padStart(2, '0');
-  const seconds = String(date.getSeconds()).padStart(2, '0');
-  return `${day}/${month}/${year} ${hours}:${minutes}:${seconds}`;
+  return Utilities.formatDate(date, UK_TIMEZONE, 'dd/MM/yyyy HH:mm:ss');
 }
 
 function formatPrice(num) {
@@ -157,7 +301,18 @@ function getSpreadsheet() {
   return SpreadsheetApp.getActiveSpreadsheet();
 }
 
+// Execution-scoped read-through cache for getSheetData. Every write made through
+// writeSheetValues/clearSheetRange drops the cached copies of the sheet it touched.
+const sheetDataCache = {};
+const sheetCacheStats = { hits: 0, misses: 0 };
+
 function getSheetData(sheetName, numHeaders = 1) {
+  const cacheKey = `${sheetName}|${numHeaders}`;
+  if (Object.prototype.hasOwnProperty.call(sheetDataCache, cacheKey)) {
+    sheetCacheStats.hits++;
+    return sheetDataCache[cacheKey];
+  }
+  sheetCacheStats.misses++;
   try {
     const sheet = getSpreadsheet().getSheetByName(sheetName);
     if (!sheet) {
@@ -170,7 +325,10 @@ function getSheetData(sheetName, numHeaders = 1) {
     const maxCols = MAX_COLS[sheetName] || 20;
     lastRow = Math.min(lastRow, numHeaders + maxRows);
     lastCol = Math.min(lastCol, maxCols);
-    if (lastRow <= numHeaders || lastCol < 1) return [];
+    if (lastRow <= numHeaders || lastCol < 1) {
+      sheetDataCache[cacheKey] = [];
+      return [];
+    }
     const rowsToRead = lastRow - numHeaders;
     if (rowsToRead * lastCol > 50000) {
       Logger.log(`WARNING: ${sheetName} wants to read ${rowsToRead} × ${lastCol} cells. Capping.`);
@@ -181,6 +339,7 @@ function getSheetData(sheetName, numHeaders = 1) {
     while (values.length > 0 && values[values.length - 1].every(cell => !cell)) {
       values.pop();
     }
+    sheetDataCache[cacheKey] = values;
     return values;
   } catch (e) {
     Logger.log(`Error reading sheet ${sheetName}: ${e.toString()}`);
@@ -188,6 +347,476 @@ function getSheetData(sheetName, numHeaders = 1) {
   }
 }
 
+// Binary search over a column A read; unparseable stamps count as older than the cutoff
+function findFirstRowOnOrAfter(timestamps, cutoffDay) {
+  let lo = 0;
+  let hi = timestamps.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    const epochDay = toEpochDay(timestamps[mid][0]);
+    if (epochDay !== null && epochDay >= cutoffDay) {
+      hi = mid;
+    } else {
+      lo = mid + 1;
+    }
+  }
+  return lo;
+}
+
+// Reads only the rows of an append-only, time-ordered sheet (archives) whose
+// column A timestamp falls on or after epoch day cutoffDay. Column A is read on its own and
+// binary-searched so the wide row read covers just the tail window.
+function getSheetDataSince(sheetName, cutoffDay, numHeaders = 1) {
+  const cacheKey = `${sheetName}|${numHeaders}|since:${cutoffDay}`;
+  if (Object.prototype.hasOwnProperty.call(sheetDataCache, cacheKey)) {
+    sheetCacheStats.hits++;
+    return sheetDataCache[cacheKey];
+  }
+  sheetCacheStats.misses++;
+  try {
+    const sheet = getSpreadsheet().getSheetByName(sheetName);
+    if (!sheet) {
+      Logger.log(`Sheet not found: ${sheetName}`);
+      return [];
+    }
+    const lastRow = sheet.getLastRow();
+    const lastCol = Math.min(sheet.getLastColumn(), MAX_COLS[sheetName] || 20);
+    if (lastRow <= numHeaders || lastCol < 1) {
+      sheetDataCache[cacheKey] = [];
+      return [];
+    }
+    
+    const timestamps = sheet.getRange(numHeaders + 1, 1, lastRow - numHeaders, 1).getValues();
+    let lo = findFirstRowOnOrAfter(timestamps, cutoffDay);
+    
+    let rowsToRead = timestamps.length - lo;
+    const maxRows = Math.min(MAX_ROWS[sheetName] || 1000, Math.floor(50000 / lastCol));
+    if (rowsToRead > maxRows) {
+      Logger.log(`WARNING: ${sheetName} tail since ${formatEpochDay(cutoffDay)} has ${rowsToRead} rows. Keeping newest ${maxRows}.`);
+      lo += rowsToRead - maxRows;
+      rowsToRead = maxRows;
+    }
+    if (rowsToRead <= 0) {
+      sheetDataCache[cacheKey] = [];
+      return [];
+    }
+    
+    const values = sheet.getRange(numHeaders + 1 + lo, 1, rowsToRead, lastCol).getValues();
+    while (values.length > 0 && values[values.length - 1].every(cell => !cell)) {
+      values.pop();
+    }
+    sheetDataCache[cacheKey] = values;
+    return values;
+  } catch (e) {
+    Logger.log(`Error reading tail of sheet ${sheetName}: ${e.toString()}`);
+    return [];
+  }
+}
+
+function columnToLetter(column) {
+  let letters = '';
+  while (column > 0) {
+    const remainder = (column - 1) % 26;
+    letters = String.fromCharCode(65 + remainder) + letters;
+    column = Math.floor((column - 1) / 26);
+  }
+  return letters;
+}
+
+// Reads several sheets in one Sheets API values.batchGet call and returns the same
+// row arrays getSheetData would, in request order. Each request is a sheet name
+// (one header row) or { sheetName, numHeaders }. Results land in the getSheetData
+// cache. Falls back to per-sheet getSheetData reads when the Sheets advanced
+// service is not enabled or the batch call fails.
+function getSheetDataBatch(requests) {
+  const normalized = requests.map(request => typeof request === 'string'
+    ? { sheetName: request, numHeaders: 1 }
+    : { sheetName: request.sheetName, numHeaders: request.numHeaders === undefined ? 1 : request.numHeaders });
+  
+  const pending = normalized.filter(request => 
+    !Object.prototype.hasOwnProperty.call(sheetDataCache, `${request.sheetName}|${request.numHeaders}`));
+  
+  if (pending.length > 1 && typeof Sheets !== 'undefined' && Sheets.Spreadsheets) {
+    try {
+      // Ranges start at row 1 so the header row fixes the width like getLastColumn does
+      const ranges = pending.map(request => {
+        const lastRow = request.numHeaders + (MAX_ROWS[request.sheetName] || 1000);
+        const lastCol = columnToLetter(MAX_COLS[request.sheetName] || 20);
+        return `'${request.sheetName.replace(/'/g, "''")}'!A1:${lastCol}${lastRow}`;
+      });
+      const response = Sheets.Spreadsheets.Values.batchGet(getSpreadsheet().getId(), {
+        ranges: ranges,
+        valueRenderOption: 'UNFORMATTED_VALUE',
+        dateTimeRenderOption: 'FORMATTED_STRING'
+      });
+      const valueRanges = response.valueRanges || [];
+      pending.forEach((request, i) => {
+        const rows = (valueRanges[i] && valueRanges[i].values) || [];
+        const width = rows.reduce((max, row) => Math.max(max, row.length), 0);
+        const values = rows.slice(request.numHeaders).map(row => {
+          const padded = row.slice();
+          while (padded.length < width) padded.push('');
+          return padded;
+        });
+        while (values.length > 0 && values[values.length - 1].every(cell => !cell)) {
+          values.pop();
+        }
+        sheetCacheStats.misses++;
+        sheetDataCache[`${request.sheetName}|${request.numHeaders}`] = values;
+      });
+    } catch (e) {
+      Logger.log(`batchGet failed, reading sheets one by one: ${e.toString()}`);
+    }
+  }
+  
+  return normalized.map(request => getSheetData(request.sheetName, request.numHeaders));
+}
+
+function invalidateSheetData(sheetName) {
+  const prefix = `${sheetName}|`;
+  Object.keys(sheetDataCache).forEach(key => {
+    if (key.indexOf(prefix) === 0) delete sheetDataCache[key];
+  });
+}
+
+function writeSheetValues(sheet, row, col, values) {
+  sheet.getRange(row, col, values.length, values[0].length).setValues(values);
+  invalidateSheetData(sheet.getName());
+}
+
+function clearSheetRange(sheet, row, col, numRows, numCols) {
+  sheet.getRange(row, col, numRows, numCols).clearContent();
+  invalidateSheetData(sheet.getName());
+}
+
+function rangeToA1(row, col, numRows, numCols) {
+  return `${columnToLetter(col)}${row}:${columnToLetter(col + numCols - 1)}${row + numRows - 1}`;
+}
+
+// Collects clears, value writes and number formats for one sheet and applies them
+// on flush() as the fewest bulk calls: vertically adjacent value blocks of the same
+// width merge into one setValues, cleared cells that get overwritten anyway are
+// skipped, and clears and formats each go out as one RangeList call per format.
+function createSheetWriteBatch(sheet) {
+  const valueBlocks = [];
+  const clears = [];
+  const formats = {};
+  
+  return {
+    clear(row, col, numRows, numCols) {
+      if (numRows > 0 && numCols > 0) clears.push({ row, col, numRows, numCols });
+    },
+    setValues(row, col, values) {
+      if (values.length > 0) valueBlocks.push({ row, col, values });
+    },
+    setNumberFormat(row, col, numRows, numCols, format) {
+      if (numRows <= 0 || numCols <= 0) return;
+      if (!formats[format]) formats[format] = [];
+      formats[format].push(rangeToA1(row, col, numRows, numCols));
+    },
+    flush() {
+      valueBlocks.sort((a, b) => a.row - b.row || a.col - b.col);
+      const merged = [];
+      valueBlocks.forEach(block => {
+        const last = merged[merged.length - 1];
+        if (last && last.col === block.col && last.row + last.values.length === block.row &&
+            last.values[0].length === block.values[0].length) {
+          last.values = last.values.concat(block.values);
+        } else {
+          merged.push({ row: block.row, col: block.col, values: block.values });
+        }
+      });
+      
+      const clearRanges = [];
+      clears.forEach(clear => {
+        let pieces = [[clear.row, clear.row + clear.numRows]];
+        merged.forEach(block => {
+          const width = block.values[0].length;
+          if (block.col > clear.col || block.col + width < clear.col + clear.numCols) return;
+          const top = block.row;
+          const bottom = block.row + block.values.length;
+          pieces = pieces.reduce((kept, [start, end]) => {
+            if (bottom <= start || top >= end) {
+              kept.push([start, end]);
+            } else {
+              if (start < top) kept.push([start, top]);
+              if (bottom < end) kept.push([bottom, end]);
+            }
+            return kept;
+          }, []);
+        });
+        pieces.forEach(([start, end]) => clearRanges.push(rangeToA1(start, clear.col, end - start, clear.numCols)));
+      });
+      
+      if (clearRanges.length > 0) {
+        sheet.getRangeList(clearRanges).clearContent();
+      }
+      merged.forEach(block => {
+        sheet.getRange(block.row, block.col, block.values.length, block.values[0].length).setValues(block.values);
+      });
+      Object.keys(formats).forEach(format => {
+        sheet.getRangeList(formats[format]).setNumberFormat(format);
+      });
+      invalidateSheetData(sheet.getName());
+      
+      valueBlocks.length = 0;
+      clears.length = 0;
+      Object.keys(formats).forEach(format => delete formats[format]);
+    }
+  };
+}
+
+function getSheetCacheStats() {
+  return { hits: sheetCacheStats.hits, misses: sheetCacheStats.misses };
+}
+
+// Logs the hits and misses since start, a getSheetCacheStats() taken when the entry
+// point began, so repeated or nested entry points in one execution each report
+// only their own reads
+function logSheetCacheStats(entryPoint, start) {
+  const hits = sheetCacheStats.hits - (start ? start.hits : 0);
+  const misses = sheetCacheStats.misses - (start ? start.misses : 0);
+  Logger.log(`${entryPoint}: sheet cache ${hits} hits, ${misses} misses`);
+}
+
+// ========================================
+// BUILD FINGERPRINTS
+// ========================================
+
+// Script properties holding { fingerprint, rows } of the last successful build
+const DASHBOARD_FINGERPRINT_PROPERTY = 'DASHBOARD_BUILD_FINGERPRINT';
+const CHEM_FINGERPRINT_PROPERTY = 'CHEM_BUILD_FINGERPRINT';
+
+function computeFingerprint(inputs) {
+  const digest = Utilities.computeDigest(
+    Utilities.DigestAlgorithm.SHA_256, JSON.stringify(inputs), Utilities.Charset.UTF_8);
+  return Utilities.base64EncodeWebSafe(digest);
+}
+
+// Inputs of a dashboard build: the watchlist, the archive it reads, mode and day.
+// manualData must come from getSheetData: getSheetDataBatch rows are padded and
+// carry dates as display strings, so they hash differently for the same sheet.
+function dashboardBuildFingerprint(manualData, mode, today) {
+  return computeFingerprint([manualData, archiveTailMarker(), mode, today]);
+}
+
+// Every log appends to the archive and rotation shrinks it, so its row count and
+// last row change whenever the history feeding the dashboard does
+function archiveTailMarker() {
+  const archiveSheet = getSpreadsheet().getSheetByName(SHEETS.ARCHIVE);
+  if (!archiveSheet) return null;
+  const lastRow = archiveSheet.getLastRow();
+  if (lastRow < 2) return [lastRow];
+  return [lastRow, archiveSheet.getRange(lastRow, 1, 1, archiveSheet.getLastColumn()).getValues()[0]];
+}
+
+// A build can be skipped when its inputs hash the same as the last build and the
+// output sheet still holds the rows that build wrote
+function isUnchangedBuild(property, fingerprint, existingRows) {
+  const stored = PropertiesService.getScriptProperties().getProperty(property);
+  if (!stored) return false;
+  const lastBuild = JSON.parse(stored);
+  return lastBuild.fingerprint === fingerprint && lastBuild.rows === existingRows.length;
+}
+
+function saveBuildFingerprint(property, fingerprint, rows) {
+  PropertiesService.getScriptProperties().setProperty(property, JSON.stringify({ fingerprint: fingerprint, rows: rows }));
+}
+
+// ========================================
+// PERSISTENT HISTORY STATS CACHE
+// ========================================
+
+// CacheService values are capped at 100KB and script properties at 9KB, so longer
+// text is split across numbered keys with the chunk count stored under the base key.
+// Sizes are in characters and allow for 4-byte UTF-8.
+const CACHE_CHUNK_CHARS = 25000;
+const PROPERTY_CHUNK_CHARS = 2250;
+const CACHE_MAX_TTL_SECONDS = 21600;
+
+function splitChunks(text, size) {
+  const chunks = [];
+  for (let i = 0; i < text.length; i += size) {
+    chunks.push(text.slice(i, i + size));
+  }
+  return chunks.length > 0 ? chunks : [''];
+}
+
+function putChunkedCache(key, text, ttlSeconds) {
+  const chunks = splitChunks(text, CACHE_CHUNK_CHARS);
+  const entries = {};
+  chunks.forEach((chunk, i) => { entries[`${key}_${i}`] = chunk; });
+  entries[key] = String(chunks.length);
+  CacheService.getScriptCache().putAll(entries, ttlSeconds || CACHE_MAX_TTL_SECONDS);
+}
+
+function getChunkedCache(key) {
+  const cache = CacheService.getScriptCache();
+  const count = parseInt(cache.get(key), 10);
+  if (!(count > 0)) return null;
+  const chunkKeys = [];
+  for (let i = 0; i < count; i++) chunkKeys.push(`${key}_${i}`);
+  const chunks = cache.getAll(chunkKeys);
+  // Chunks are evicted independently, so any gap means a miss
+  if (chunkKeys.some(chunkKey => typeof chunks[chunkKey] !== 'string')) return null;
+  return chunkKeys.map(chunkKey => chunks[chunkKey]).join('');
+}
+
+function removeChunkedCache(key) {
+  const cache = CacheService.getScriptCache();
+  const count = parseInt(cache.get(key), 10) || 0;
+  const keys = [key];
+  for (let i = 0; i < count; i++) keys.push(`${key}_${i}`);
+  cache.removeAll(keys);
+}
+
+function putChunkedProperty(key, text) {
+  const props = PropertiesService.getScriptProperties();
+  const oldCount = parseInt(props.getProperty(key), 10) || 0;
+  const chunks = splitChunks(text, PROPERTY_CHUNK_CHARS);
+  const entries = {};
+  chunks.forEach((chunk, i) => { entries[`${key}_${i}`] = chunk; });
+  entries[key] = String(chunks.length);
+  props.setProperties(entries);
+  for (let i = chunks.length; i < oldCount; i++) {
+    props.deleteProperty(`${key}_${i}`);
+  }
+}
+
+function getChunkedProperty(key) {
+  const props = PropertiesService.getScriptProperties();
+  const count = parseInt(props.getProperty(key), 10);
+  if (!(count > 0)) return null;
+  const chunks = [];
+  for (let i = 0; i < count; i++) {
+    const chunk = props.getProperty(`${key}_${i}`);
+    if (chunk === null) return null;
+    chunks.push(chunk);
+  }
+  return chunks.join('');
+}
+
+function deleteChunkedProperty(key) {
+  const props = PropertiesService.getScriptProperties();
+  const count = parseInt(props.getProperty(key), 10) || 0;
+  props.deleteProperty(key);
+  for (let i = 0; i < count; i++) {
+    props.deleteProperty(`${key}_${i}`);
+  }
+}
+
+// History stats per (player, version) for one UK day:
+// { day, generation, players: { name: { version: [low7D, low14D, prevLow8to14D, avg3D, high7D] } } }
+// Kept in CacheService with a script-properties copy for when the cache is evicted.
+// generation counts invalidations, so a build that read the stats before a log
+// does not write back stats the log made stale.
+const HISTORY_STATS_KEY = 'HISTORY_STATS';
+
+function readHistoryStatsBlob() {
+  const cached = getChunkedCache(HISTORY_STATS_KEY);
+  if (cached) return JSON.parse(cached);
+  const stored = getChunkedProperty(HISTORY_STATS_KEY);
+  if (!stored) return null;
+  putChunkedCache(HISTORY_STATS_KEY, stored);
+  return JSON.parse(stored);
+}
+
+function writeHistoryStatsBlob(blob) {
+  const text = JSON.stringify(blob);
+  putChunkedCache(HISTORY_STATS_KEY, text);
+  putChunkedProperty(HISTORY_STATS_KEY, text);
+}
+
+function loadHistoryStats(today) {
+  const blob = readHistoryStatsBlob();
+  if (!blob) return { day: today, generation: 0, players: {} };
+  if (blob.day !== today) return { day: today, generation: blob.generation, players: {} };
+  return blob;
+}
+
+// Adds stats' players to the stored blob rather than replacing it, so parallel
+// shard calls that each loaded the blob before the others saved keep every entry
+function saveHistoryStats(stats) {
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    const current = readHistoryStatsBlob();
+    if (current && current.generation !== stats.generation) return;
+    const merged = current && current.day === stats.day
+      ? current
+      : { day: stats.day, generation: stats.generation, players: {} };
+    Object.keys(stats.players).forEach(playerName => {
+      merged.players[playerName] = Object.assign(merged.players[playerName] || {}, stats.players[playerName]);
+    });
+    writeHistoryStatsBlob(merged);
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+// Drops every version of the given players, or of every player when playerNames is
+// omitted; called after they are logged or the history they read is rewritten
+function invalidateHistoryStats(playerNames) {
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    const blob = readHistoryStatsBlob();
+    if (!blob) return;
+    if (playerNames) {
+      playerNames.forEach(playerName => { delete blob.players[playerName]; });
+    } else {
+      blob.players = {};
+    }
+    blob.generation++;
+    writeHistoryStatsBlob(blob);
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+// getPlayerHistory results for each named Manual Data Entry row, keyed
+// `${player}|${version}`. Today's cached stats are reused and only uncached
+// players are aggregated from the archive, so a warm build reads no history.
+function loadPlayerHistories(manualRows, historyWindow) {
+  const stats = loadHistoryStats(historyWindow.today);
+  const histories = {};
+  const uncachedRows = [];
+  manualRows.forEach(row => {
+    if (!row[0]) return;
+    const version = row[1] || '';
+    const cached = stats.players[row[0]] && stats.players[row[0]][version];
+    if (cached) {
+      histories[`${row[0]}|${version}`] = {
+        low7D: cached[0],
+        low14D: cached[1],
+        prevLow8to14D: cached[2],
+        avg3D: cached[3],
+        high7D: cached[4]
+      };
+    } else {
+      uncachedRows.push(row);
+    }
+  });
+  
+  if (uncachedRows.length > 0) {
+    // Only the last 14 days feed any history window
+    const historyIndex = loadHistoryIndex(historyWindow.fourteenDaysAgo, new Set(uncachedRows.map(row => row[0])));
+    uncachedRows.forEach(row => {
+      const version = row[1] || '';
+      const history = getPlayerHistory(row[0], version, historyIndex, historyWindow);
+      histories[`${row[0]}|${version}`] = history;
+      if (!stats.players[row[0]]) stats.players[row[0]] = {};
+      stats.players[row[0]][version] = [history.low7D, history.low14D, history.prevLow8to14D, history.avg3D, history.high7D];
+    });
+    try {
+      saveHistoryStats(stats);
+    } catch (e) {
+      Logger.log(`Could not save history stats cache: ${e.toString()}`);
+    }
+  }
+  return histories;
+}
+
 // ========================================
 // FLUCTUATIONS AREA
 // ========================================
@@ -198,16 +827,18 @@ function loadPreferences() {
     if (!sheet) {
       const newSheet = getSpreadsheet().insertSheet(SHEETS.PREFERENCES);
       newSheet.appendRow([DEFAULT_VISIBLE_COLUMNS.join(',')]);
+      invalidateSheetData(SHEETS.PREFERENCES);
       return DEFAULT_VISIBLE_COLUMNS;
     }
-    const value = sheet.getRange('A1').getValue();
+    const preferenceData = getSheetData(SHEETS.PREFERENCES, 0);
+    const value = preferenceData.length > 0 ? preferenceData[0][0] : '';
     if (typeof value === 'string' && value.length > 0) {
       const indices = value.split(',').map(s => parseInt(s.trim(), 10)).filter(n => !isNaN(n));
       if (!indices.includes(0)) indices.push(0);
       if (!indices.includes(1)) indices.push(1);
       return [...new Set(indices)].sort((a, b) => a - b);
     }
-    sheet.getRange('A1').setValue(DEFAULT_VISIBLE_COLUMNS.join(','));
+    writeSheetValues(sheet, 1, 1, [[DEFAULT_VISIBLE_COLUMNS.join(',')]]);
     return DEFAULT_VISIBLE_COLUMNS;
   } catch (e) {
     Logger.log(`Error loading preferences: ${e.toString()}`);
@@ -220,7 +851,8 @@ function savePreferences(visibleColumns) {
     const sheet = getSpreadsheet().getSheetByName(SHEETS.PREFERENCES);
     if (!sheet) throw new Error(`Sheet not found: ${SHEETS.PREFERENCES}`);
     const preferenceString = visibleColumns.filter(n => n >= 0 && n < COLUMN_HEADERS.length).join(',');
-    sheet.getRange('A1').setValue(preferenceString);
+    writeSheetValues(sheet, 1, 1, [[preferenceString]]);
+    clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
     return 'Preferences saved successfully.';
   } catch (e) {
     Logger.log(`Error saving preferences: ${e.toString()}`);
@@ -235,15 +867,10 @@ function detectMarketCrash(manualData) {
   let validCount = 0;
   for (let i = 0; i < manualData.length; i++) {
     const movementPct = manualData[i][10];
-    if (movementPct && typeof movementPct === 'string') {
-      const pctStr = movementPct.replace('%', '').trim();
-      const pct = parseFloat(pctStr);
-      if (!isNaN(pct)) {
-        totalMovement += pct;
-        validCount++;
-      }
-    } else if (typeof movementPct === 'number') {
-      totalMovement += movementPct;
+    if (typeof movementPct !== 'number' && typeof movementPct !== 'string') continue;
+    const pct = parsePercent(movementPct);
+    if (!isNaN(pct)) {
+      totalMovement += pct;
       validCount++;
     }
   }
@@ -253,6 +880,7 @@ function detectMarketCrash(manualData) {
 }
 
 function logManualData() {
+  const cacheStatsStart = getSheetCacheStats();
   try {
     const ss = getSpreadsheet();
     const manualSheet = ss.getSheetByName(SHEETS.MANUAL);
@@ -272,28 +900,54 @@ function logManualData() {
       if (!playerName) continue;
       const maxCols = MAX_COLS[SHEETS.MANUAL] || 12;
       const trimmedRow = row.slice(0, maxCols);
-      const archiveRow = [ukTimestamp, ...trimmedRow];
+      const archiveRow = normalizeArchiveRow(
+        [ukTimestamp, ...trimmedRow],
+        ARCHIVE_PRICE_COLUMNS,
+        ARCHIVE_PERCENT_COLUMNS,
+        KEEP_RAW_ARCHIVE_TEXT ? MAX_COLS[SHEETS.ARCHIVE] : 0
+      );
       archiveRows.push(archiveRow);
     }
     if (archiveRows.length === 0) {
       return { success: false, message: 'No valid data rows to archive' };
     }
-    const existingArchiveData = getSheetData(SHEETS.ARCHIVE, 1);
-    const startRow = existingArchiveData.length + 2;
+    let startRow = Math.max(archiveSheet.getLastRow(), 1) + 1;
     const maxArchiveRows = MAX_ROWS[SHEETS.ARCHIVE] || 5000;
-    if (startRow + archiveRows.length > maxArchiveRows + 1) {
+    if (startRow - 2 + archiveRows.length > maxArchiveRows) {
+      rotateArchive(SHEETS.ARCHIVE, toEpochDay(now) - ANALYSIS_HORIZON_DAYS);
+      startRow = Math.max(archiveSheet.getLastRow(), 1) + 1;
+    }
+    if (startRow - 2 + archiveRows.length > maxArchiveRows) {
+      // The horizon holds more logs than the archive fits. The analysis reads the
+      // daily rollup once it exists, so backfill it from the archive while that is
+      // still complete, then move the oldest days out even though they are recent.
+      if (!ss.getSheetByName(SHEETS.ROLLUP)) {
+        const rebuilt = rebuildDailyRollup();
+        if (!rebuilt.success) return rebuilt;
+      }
+      const rolledThrough = rotateOldestArchiveDays(SHEETS.ARCHIVE, archiveRows.length);
+      if (rolledThrough !== null) {
+        const props = PropertiesService.getScriptProperties();
+        const previous = Number(props.getProperty(ARCHIVE_ROLLED_THROUGH_PROPERTY));
+        props.setProperty(ARCHIVE_ROLLED_THROUGH_PROPERTY, String(Math.max(previous || 0, rolledThrough)));
+      }
+      startRow = Math.max(archiveSheet.getLastRow(), 1) + 1;
+    }
+    if (startRow - 2 + archiveRows.length > maxArchiveRows) {
       return { 
         success: false, 
         message: `Archive is approaching maximum size (${maxArchiveRows} rows). Please clean up old data.` 
       };
     }
-    const maxArchiveCols = MAX_COLS[SHEETS.ARCHIVE] || 13;
-    archiveSheet.getRange(startRow, 1, archiveRows.length, Math.min(archiveRows[0].length, maxArchiveCols)).setValues(archiveRows);
+    writeSheetValues(archiveSheet, startRow, 1, archiveRows);
+    updateDailyRollup(archiveRows);
+    invalidateHistoryStats(archiveRows.map(row => row[1]));
     const manualLastRow = Math.min(manualSheet.getLastRow(), MAX_ROWS[SHEETS.MANUAL] + 1);
     if (manualLastRow > 1) {
       const manualLastCol = Math.min(manualSheet.getLastColumn(), MAX_COLS[SHEETS.MANUAL]);
-      manualSheet.getRange(2, 1, manualLastRow - 1, manualLastCol).clearContent();
+      clearSheetRange(manualSheet, 2, 1, manualLastRow - 1, manualLastCol);
     }
+    clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
     return { 
       success: true, 
       message: `Successfully logged ${archiveRows.length} rows to Historic Archive at ${ukTimestamp} (UK time)` 
@@ -301,113 +955,203 @@ function logManualData() {
   } catch (e) {
     Logger.log(`Error in logManualData: ${e.toString()}`);
     return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('logManualData', cacheStatsStart);
   }
 }
 
 function buildDashboardNormal() {
-  return buildDashboardWithMode('normal');
+  return runDashboardBuild('normal');
 }
 
 function buildDashboardCrash() {
-  return buildDashboardWithMode('crash');
+  return runDashboardBuild('crash');
 }
 
 function buildDashboardRise() {
-  return buildDashboardWithMode('rise');
+  return runDashboardBuild('rise');
 }
 
 function buildDashboardInvestments() {
-  return buildDashboardWithMode('investments');
+  return runDashboardBuild('investments');
 }
 
-function getPlayerHistory(playerName, version, historicData, sevenDaysAgo, threeDaysAgo, fourteenDaysAgo, eightDaysAgo) {
-  const result = {
-    low7D: 0,
-    low14D: 0,
-    prevLow8to14D: 0,
-    avg3D: 0,
-    high7D: 0
-  };
-  
-  if (!historicData || historicData.length === 0) {
-    return result;
+// Runs the build as a resumable job so large watchlists finish across executions
+function runDashboardBuild(mode) {
+  try {
+    return startJob('dashboardBuild', { mode: mode });
+  } catch (e) {
+    Logger.log(`Error in runDashboardBuild: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  }
+}
+
+function addHistoryEntry(index, playerName, version, entry) {
+  let versions = index.get(playerName);
+  if (!versions) {
+    versions = new Map();
+    index.set(playerName, versions);
+  }
+  let entries = versions.get(version);
+  if (!entries) {
+    entries = [];
+    versions.set(version, entries);
   }
+  entries.push(entry);
+}
+
+function buildHistoryIndex(historicData, playerFilter) {
+  // One pass over the archive: player name -> version -> entries sorted newest first.
+  // playerFilter (a Set of names) limits the index to those players.
+  const index = new Map();
+  if (!historicData || historicData.length === 0) return index;
   
-  const playerRows = [];
   for (let i = 0; i < historicData.length; i++) {
     try {
       const row = historicData[i];
-      const dateStr = row[0];
       const histPlayerName = row[1];
-      const histVersion = row[2] || '';
+      if (!histPlayerName) continue;
+      if (playerFilter && !playerFilter.has(histPlayerName)) continue;
       
-      if (histPlayerName !== playerName) continue;
-      if (version && histVersion && version !== histVersion) continue;
+      const epochDay = toEpochDay(row[0]);
+      if (epochDay === null) continue;
       
-      const date = parseDate(dateStr);
-      if (!date) continue;
-      
-      // FIXED: Normalize to midnight for proper date comparison
-      date.setHours(0, 0, 0, 0);
       const currentPrice = parsePrice(row[3]);
       const lowPoint = parsePrice(row[4]);
       const high24H = parsePrice(row[10]);
       
       if (currentPrice <= 0 && lowPoint <= 0 && high24H <= 0) continue;
       
-      playerRows.push({
-        date: date,
-        currentPrice: currentPrice,
+      addHistoryEntry(index, histPlayerName, row[2] || '', {
+        day: epochDay,
+        seq: i,
+        priceSum: currentPrice > 0 ? currentPrice : 0,
+        priceCount: currentPrice > 0 ? 1 : 0,
         lowPoint: lowPoint,
         high24H: high24H
       });
     } catch (e) {
-      Logger.log(`Error processing historic row for ${playerName}: ${e.toString()}`);
+      Logger.log(`Error indexing historic row ${i}: ${e.toString()}`);
       continue;
     }
   }
   
+  index.forEach(versions => versions.forEach(entries => entries.sort(compareHistoryEntries)));
+  return index;
+}
+
+function buildRollupHistoryIndex(rollupData, playerFilter) {
+  // Same shape as buildHistoryIndex, but one entry per player, version and day
+  const index = new Map();
+  if (!rollupData || rollupData.length === 0) return index;
+  
+  for (let i = 0; i < rollupData.length; i++) {
+    const row = rollupData[i];
+    const playerName = row[1];
+    if (!playerName) continue;
+    if (playerFilter && !playerFilter.has(playerName)) continue;
+    
+    const epochDay = toEpochDay(row[0]);
+    if (epochDay === null) continue;
+    
+    addHistoryEntry(index, playerName, row[2] || '', {
+      day: epochDay,
+      seq: i,
+      priceSum: parsePrice(row[5]),
+      priceCount: parsePrice(row[6]),
+      lowPoint: parsePrice(row[3]),
+      high24H: parsePrice(row[4]),
+      firstLows: parseRollupLows(row[7])
+    });
+  }
+  
+  index.forEach(versions => versions.forEach(entries => entries.sort(compareHistoryEntries)));
+  return index;
+}
+
+function compareHistoryEntries(a, b) {
+  return b.day - a.day || a.seq - b.seq;
+}
+
+function getHistoryEntries(historyIndex, playerName, version) {
+  const versions = historyIndex ? historyIndex.get(playerName) : null;
+  if (!versions) return [];
+  
+  // Archive rows without a version match any version, and an unversioned lookup matches every row
+  let lists;
+  if (version) {
+    lists = [versions.get(version), versions.get('')].filter(Boolean);
+  } else {
+    lists = Array.from(versions.values());
+  }
+  
+  if (lists.length === 0) return [];
+  if (lists.length === 1) return lists[0];
+  return [].concat(...lists).sort(compareHistoryEntries);
+}
+
+function getPlayerHistory(playerName, version, historyIndex, historyWindow) {
+  const result = {
+    low7D: 0,
+    low14D: 0,
+    prevLow8to14D: 0,
+    avg3D: 0,
+    high7D: 0
+  };
+  
+  const playerRows = getHistoryEntries(historyIndex, playerName, version);
+  
   if (playerRows.length === 0) {
     return result;
   }
   
-  playerRows.sort((a, b) => b.date.getTime() - a.date.getTime());
+  const threeDaysAgo = historyWindow.threeDaysAgo;
+  const sevenDaysAgo = historyWindow.sevenDaysAgo;
+  const fourteenDaysAgo = historyWindow.fourteenDaysAgo;
   
   const lowPoints7D = [];
+  const recentLows = [];
   const lowPoints14D = [];
   const lowPoints8to14D = [];
-  const currentPrices3D = [];
   const highPrices7D = [];
+  let priceSum3D = 0;
+  let priceCount3D = 0;
   
   for (let i = 0; i < playerRows.length; i++) {
     const row = playerRows[i];
+    // Entries are newest first, so nothing past the oldest window can contribute
+    if (row.day < fourteenDaysAgo) break;
     
-    if (row.date >= sevenDaysAgo) {
+    if (row.day >= sevenDaysAgo) {
       if (row.lowPoint > 0) {
         lowPoints7D.push(row.lowPoint);
+        // A rollup entry stands for a whole day, so it brings that day's first lows
+        // in archive order, the same snapshots the raw archive rows would give
+        if (recentLows.length < AVG_3D_FALLBACK_LOWS) {
+          recentLows.push(...(row.firstLows && row.firstLows.length > 0 ? row.firstLows : [row.lowPoint]));
+        }
       }
       if (row.high24H > 0) {
         highPrices7D.push(row.high24H);
       }
       
-      if (row.date >= threeDaysAgo) {
-        if (row.currentPrice > 0) {
-          currentPrices3D.push(row.currentPrice);
+      if (row.day >= threeDaysAgo) {
+        if (row.priceCount > 0) {
+          priceSum3D += row.priceSum;
+          priceCount3D += row.priceCount;
         }
       }
     }
     
-    // FIXED: Use >= for lower bound to include day 14, < for upper bound to exclude day 7
-    if (fourteenDaysAgo && eightDaysAgo && row.date >= fourteenDaysAgo && row.date < sevenDaysAgo) {
+    // Days 8-14: older than the 7-day window; the break above already drops anything past day 14
+    if (row.day < sevenDaysAgo) {
       if (row.lowPoint > 0) {
         lowPoints8to14D.push(row.lowPoint);
       }
     }
     
-    if (fourteenDaysAgo && row.date >= fourteenDaysAgo) {
-      if (row.lowPoint > 0) {
-        lowPoints14D.push(row.lowPoint);
-      }
+    if (row.lowPoint > 0) {
+      lowPoints14D.push(row.lowPoint);
     }
   }
   
@@ -423,13 +1167,12 @@ function getPlayerHistory(playerName, version, historicData, sevenDaysAgo, three
     result.prevLow8to14D = Math.min(...lowPoints8to14D);
   }
   
-  if (currentPrices3D.length > 0) {
-    const sum = currentPrices3D.reduce((a, b) => a + b, 0);
-    result.avg3D = Math.round(sum / currentPrices3D.length);
-  } else if (lowPoints7D.length > 0) {
-    const recentLows = lowPoints7D.slice(0, Math.min(3, lowPoints7D.length));
-    const sum = recentLows.reduce((a, b) => a + b, 0);
-    result.avg3D = Math.round(sum / recentLows.length);
+  if (priceCount3D > 0) {
+    result.avg3D = Math.round(priceSum3D / priceCount3D);
+  } else if (recentLows.length > 0) {
+    const fallbackLows = recentLows.slice(0, AVG_3D_FALLBACK_LOWS);
+    const sum = fallbackLows.reduce((a, b) => a + b, 0);
+    result.avg3D = Math.round(sum / fallbackLows.length);
   }
   
   if (highPrices7D.length > 0) {
@@ -439,270 +1182,1116 @@ function getPlayerHistory(playerName, version, historicData, sevenDaysAgo, three
   return result;
 }
 
-function buildDashboardWithMode(mode) {
+// Prefers the daily rollup (one row per player, version and day) once it has been
+// backfilled by rebuildDailyRollup; falls back to the raw archive tail otherwise.
+function loadHistoryIndex(sinceDay, playerFilter) {
+  if (getSpreadsheet().getSheetByName(SHEETS.ROLLUP)) {
+    return buildRollupHistoryIndex(getSheetDataSince(SHEETS.ROLLUP, sinceDay, 1), playerFilter);
+  }
+  return buildHistoryIndex(getSheetDataSince(SHEETS.ARCHIVE, sinceDay, 1), playerFilter);
+}
+
+function accumulateRollup(rollupMap, dayKey, playerName, version, currentPrice, lowPoint, high24H) {
+  if (currentPrice <= 0 && lowPoint <= 0 && high24H <= 0) return false;
+  const key = `${dayKey}|${playerName}|${version}`;
+  let rollupRow = rollupMap.get(key);
+  if (!rollupRow) {
+    rollupRow = [dayKey, playerName, version, 0, 0, 0, 0, ''];
+    rollupMap.set(key, rollupRow);
+  }
+  if (lowPoint > 0 && (rollupRow[3] === 0 || lowPoint < rollupRow[3])) rollupRow[3] = lowPoint;
+  if (lowPoint > 0) {
+    const firstLows = parseRollupLows(rollupRow[7]);
+    if (firstLows.length < AVG_3D_FALLBACK_LOWS) rollupRow[7] = firstLows.concat(lowPoint).join(' ');
+  }
+  if (high24H > rollupRow[4]) rollupRow[4] = high24H;
+  if (currentPrice > 0) {
+    rollupRow[5] += currentPrice;
+    rollupRow[6] += 1;
+  }
+  return true;
+}
+
+// "First Today's Lows" holds up to AVG_3D_FALLBACK_LOWS lows separated by spaces.
+// Rollups built before the column existed leave it blank.
+function parseRollupLows(value) {
+  if (value === '' || value === null || value === undefined) return [];
+  return String(value).split(' ').map(parsePrice).filter(low => low > 0);
+}
+
+function rollupDayKey(value) {
+  const epochDay = toEpochDay(value);
+  return epochDay !== null ? formatEpochDay(epochDay) : '';
+}
+
+function updateDailyRollup(archiveRows) {
   try {
-    const ss = getSpreadsheet();
-    const dashboardSheet = ss.getSheetByName(SHEETS.DASHBOARD);
+    const rollupSheet = getSpreadsheet().getSheetByName(SHEETS.ROLLUP);
+    // The rollup is opt-in: it only exists once rebuildDailyRollup has backfilled it
+    if (!rollupSheet || archiveRows.length === 0) return;
     
-    if (!dashboardSheet) {
-      return { success: false, message: 'Dashboard Analysis sheet not found' };
-    }
+    const dayKey = rollupDayKey(archiveRows[0][0]);
+    if (!dayKey) return;
     
-    const manualData = getSheetData(SHEETS.MANUAL, 1);
-    const historicData = getSheetData(SHEETS.ARCHIVE, 1);
+    // Today's rollup rows are always the trailing block of the sheet. Column A is
+    // read to the real last row (a capped getSheetData read keeps the oldest rows
+    // and would misplace the block) and only today's rows are read in full.
+    const lastRow = rollupSheet.getLastRow();
+    const timestamps = lastRow > 1 ? rollupSheet.getRange(2, 1, lastRow - 1, 1).getValues() : [];
+    let firstTodayIdx = timestamps.length;
+    while (firstTodayIdx > 0 && rollupDayKey(timestamps[firstTodayIdx - 1][0]) === dayKey) {
+      firstTodayIdx--;
+    }
+    const todayCount = timestamps.length - firstTodayIdx;
+    const todayRows = todayCount > 0
+      ? rollupSheet.getRange(firstTodayIdx + 2, 1, todayCount, ROLLUP_HEADERS.length).getValues()
+      : [];
     
-    if (manualData.length === 0) {
-      return { success: false, message: 'No data in Manual Data Entry sheet' };
+    const rollupMap = new Map();
+    for (let i = 0; i < todayRows.length; i++) {
+      const row = todayRows[i];
+      const rollupRow = [dayKey, row[1], row[2] || '', parsePrice(row[3]), parsePrice(row[4]), parsePrice(row[5]), parsePrice(row[6]), row[7] || ''];
+      rollupMap.set(`${dayKey}|${rollupRow[1]}|${rollupRow[2]}`, rollupRow);
     }
     
-    const dashLastRow = Math.min(dashboardSheet.getLastRow(), MAX_ROWS[SHEETS.DASHBOARD] + 1);
-    const dashLastCol = Math.min(dashboardSheet.getLastColumn(), MAX_COLS[SHEETS.DASHBOARD]);
-    if (dashLastRow > 1 && dashLastCol > 0) {
-      dashboardSheet.getRange(2, 1, dashLastRow - 1, dashLastCol).clearContent();
+    for (let i = 0; i < archiveRows.length; i++) {
+      const row = archiveRows[i];
+      accumulateRollup(rollupMap, dayKey, row[1], row[2] || '', parsePrice(row[3]), parsePrice(row[4]), parsePrice(row[10]));
     }
     
-    dashboardSheet.getRange(1, 1, 1, COLUMN_HEADERS.length).setValues([COLUMN_HEADERS]);
+    const rollupRows = Array.from(rollupMap.values());
+    if (rollupRows.length > 0) {
+      writeSheetValues(rollupSheet, firstTodayIdx + 2, 1, rollupRows);
+    }
+  } catch (e) {
+    Logger.log(`Error updating daily rollup: ${e.toString()}`);
+  }
+}
+
+function rebuildDailyRollup() {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const ss = getSpreadsheet();
+    const historyWindow = getHistoryWindow(toEpochDay(new Date()));
     
-    const dashboardRows = [];
-    const today = new Date();
-    today.setHours(0, 0, 0, 0);
-    const sevenDaysAgo = new Date(today.getTime() - 7 * 24 * 60 * 60 * 1000);
-    const eightDaysAgo = new Date(today.getTime() - 8 * 24 * 60 * 60 * 1000);
-    const threeDaysAgo = new Date(today.getTime() - 3 * 24 * 60 * 60 * 1000);
-    const fourteenDaysAgo = new Date(today.getTime() - 14 * 24 * 60 * 60 * 1000);
+    // Days whose raw rows logManualData already moved out can't be rebuilt from the
+    // archive, so their existing rollup rows are kept as they are
+    let rollupSheet = ss.getSheetByName(SHEETS.ROLLUP);
+    const rolledThrough = rollupSheet
+      ? Number(PropertiesService.getScriptProperties().getProperty(ARCHIVE_ROLLED_THROUGH_PROPERTY)) || 0
+      : 0;
+    const rollupMap = new Map();
+    if (rolledThrough >= historyWindow.fourteenDaysAgo) {
+      const keptRows = getSheetDataSince(SHEETS.ROLLUP, historyWindow.fourteenDaysAgo, 1);
+      for (let i = 0; i < keptRows.length; i++) {
+        const row = keptRows[i];
+        const epochDay = toEpochDay(row[0]);
+        if (epochDay === null || epochDay > rolledThrough || !row[1]) continue;
+        const dayKey = formatEpochDay(epochDay);
+        rollupMap.set(`${dayKey}|${row[1]}|${row[2] || ''}`,
+          [dayKey, row[1], row[2] || '', parsePrice(row[3]), parsePrice(row[4]), parsePrice(row[5]), parsePrice(row[6]), row[7] || '']);
+      }
+    }
     
-    for (let i = 0; i < manualData.length; i++) {
-      try {
-        const manualRow = manualData[i];
-        const playerName = manualRow[0];
-        if (!playerName) continue;
-        
-        const version = manualRow[1] || '';
-        const currentPrice = parsePrice(manualRow[2]);
-        const todaysLowPoint = parsePrice(manualRow[3]);
-        const sixHAvg = parsePrice(manualRow[5]);
-        const high3H = parsePrice(manualRow[6]);
-        const high6H = parsePrice(manualRow[7]);
-        const high12H = parsePrice(manualRow[8]);
-        const high24H = parsePrice(manualRow[9]);
-        const movementPct = manualRow[10] || '';
-        
-        const playerHistory = getPlayerHistory(playerName, version, historicData, sevenDaysAgo, threeDaysAgo, fourteenDaysAgo, eightDaysAgo);
-        
-        const historicalLow7D = playerHistory.low7D;
-        const historicalLow14D = playerHistory.low14D;
-        const prevLow8to14D = playerHistory.prevLow8to14D;
-        const historicalAvg3D = playerHistory.avg3D;
-        let historicalHigh7D = playerHistory.high7D;
-        
-        if (high24H > 0 && high24H > historicalHigh7D) {
-          historicalHigh7D = high24H;
-        }
-        
-        // FIXED: % From Low Point - ALWAYS uses Today's Low Point
-        let pctFromLowPoint = '';
-        if (todaysLowPoint > 0 && currentPrice > 0) {
-          pctFromLowPoint = (((currentPrice - todaysLowPoint) / todaysLowPoint) * 100).toFixed(2) + '%';
-        }
-        
-        // FIXED: % From Hist Low (7D) - ALWAYS uses Historical Low (7D)
-        let pctFromHistLow7D = '';
-        if (historicalLow7D > 0 && currentPrice > 0) {
-          const pct = ((currentPrice - historicalLow7D) / historicalLow7D) * 100;
-          pctFromHistLow7D = pct.toFixed(2) + '%';
-        }
-        
-        // FIXED: % From 14D Low - ALWAYS uses Prev Low to 7D Low (14D) which is the 8-14 day window
-        let pctFrom14DLow = '';
-        if (prevLow8to14D > 0 && currentPrice > 0) {
-          const pct = ((currentPrice - prevLow8to14D) / prevLow8to14D) * 100;
-          pctFrom14DLow = pct.toFixed(2) + '%';
-        }
-        
-        // FIXED: Show Prev Low to 7D Low for ALL modes (removed mode gate)
-        let prevLowTo7DLow = '';
-        if (prevLow8to14D > 0) {
-          prevLowTo7DLow = prevLow8to14D;
-        }
-        
-        let targetBuy = 0;
-        let targetSell = 0;
-        
-        if (mode === 'investments') {
-          if (high6H > 0) {
-            targetBuy = high6H / 1.1025;
-            targetBuy = roundToMarketPrice(targetBuy);
-          } else if (todaysLowPoint > 0) {
-            const buyBuffer = Math.max(500, todaysLowPoint * 0.01);
-            targetBuy = todaysLowPoint - buyBuffer;
-            targetBuy = roundToMarketPrice(targetBuy);
-          }
-          
-          const tmtValues = [sixHAvg, high3H, high6H].filter(val => val > 0);
-          if (tmtValues.length > 0) {
-            const tmtAverage = tmtValues.reduce((a, b) => a + b, 0) / tmtValues.length;
-            targetSell = roundToMarketPrice(tmtAverage);
-          }
-        } else if (mode === 'crash') {
-          if (todaysLowPoint > 0) {
-            if (historicalLow7D > 0 && historicalLow7D < todaysLowPoint) {
-              const avgLow = (historicalLow7D + todaysLowPoint) / 2;
-              const buyBuffer = Math.max(500, avgLow * 0.01);
-              targetBuy = avgLow - buyBuffer;
-              targetBuy = roundToMarketPrice(targetBuy);
-            } else {
-              const buyBuffer = Math.max(500, todaysLowPoint * 0.01);
-              targetBuy = todaysLowPoint - buyBuffer;
-              targetBuy = roundToMarketPrice(targetBuy);
-            }
-          } else if (currentPrice > 0) {
-            targetBuy = currentPrice - 500;
-            targetBuy = roundToMarketPrice(targetBuy);
-          }
-          
-          const crashSellOptions = [sixHAvg, high6H].filter(val => val > 0);
-          if (crashSellOptions.length > 0) {
-            targetSell = Math.max(...crashSellOptions);
-            targetSell = roundToMarketPrice(targetSell);
-          }
-        } else if (mode === 'rise') {
-          if (currentPrice > 0 && high24H > 0) {
-            const nearPeakThreshold = high24H * 0.98;
-            if (currentPrice >= nearPeakThreshold) {
-              const safetyOption1 = todaysLowPoint || 0;
-              const safetyOption2 = historicalAvg3D > 0 ? historicalAvg3D * 0.99 : 0;
-              const safetyFloor = Math.max(safetyOption1, safetyOption2);
-              if (safetyFloor > 0) {
-                targetBuy = roundDownToMarketPrice(safetyFloor);
-              }
-            } else {
-              targetBuy = currentPrice * 0.98;
-              targetBuy = roundDownToMarketPrice(targetBuy);
-            }
-          }
-          
-          if (historicalHigh7D > 0 && high24H > 0 && historicalAvg3D > 0) {
-            const weightedAvg = (historicalHigh7D * 0.4) + (high24H * 0.4) + (historicalAvg3D * 0.2);
-            targetSell = weightedAvg * 1.02;
-            targetSell = roundToMarketPrice(targetSell);
-          } else if (historicalHigh7D > 0 || high24H > 0) {
-            const maxHigh = Math.max(historicalHigh7D || 0, high24H || 0);
-            targetSell = maxHigh * 0.98;
-            targetSell = roundToMarketPrice(targetSell);
-          }
+    // A full archive's window is past getSheetDataSince's cell cap, which would drop
+    // its oldest days, so the window is read in blocks instead
+    const archiveSheet = ss.getSheetByName(SHEETS.ARCHIVE);
+    const archiveLastRow = archiveSheet ? archiveSheet.getLastRow() : 0;
+    const timestamps = archiveLastRow > 1 ? archiveSheet.getRange(2, 1, archiveLastRow - 1, 1).getValues() : [];
+    const firstIdx = findFirstRowOnOrAfter(timestamps, historyWindow.fourteenDaysAgo);
+    for (let start = firstIdx; start < timestamps.length; start += ARCHIVE_BLOCK_ROWS) {
+      const numRows = Math.min(ARCHIVE_BLOCK_ROWS, timestamps.length - start);
+      const historicData = archiveSheet.getRange(start + 2, 1, numRows, MAX_COLS[SHEETS.ARCHIVE]).getValues();
+      for (let i = 0; i < historicData.length; i++) {
+        const row = historicData[i];
+        if (!row[1]) continue;
+        const epochDay = toEpochDay(row[0]);
+        if (epochDay === null || epochDay <= rolledThrough) continue;
+        accumulateRollup(rollupMap, formatEpochDay(epochDay), row[1], row[2] || '', parsePrice(row[3]), parsePrice(row[4]), parsePrice(row[10]));
+      }
+    }
+    
+    if (!rollupSheet) {
+      rollupSheet = ss.insertSheet(SHEETS.ROLLUP);
+    }
+    const lastRow = rollupSheet.getLastRow();
+    if (lastRow > 1) {
+      clearSheetRange(rollupSheet, 2, 1, lastRow - 1, ROLLUP_HEADERS.length);
+    }
+    writeSheetValues(rollupSheet, 1, 1, [ROLLUP_HEADERS]);
+    
+    const rollupRows = Array.from(rollupMap.values());
+    if (rollupRows.length > 0) {
+      writeSheetValues(rollupSheet, 2, 1, rollupRows);
+    }
+    // Builds now read history from the rollup instead of the raw archive
+    invalidateHistoryStats();
+    return { 
+      success: true, 
+      message: `Rebuilt ${SHEETS.ROLLUP} with ${rollupRows.length} rows from ${timestamps.length - firstIdx} archive rows` 
+    };
+  } catch (e) {
+    Logger.log(`Error in rebuildDailyRollup: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('rebuildDailyRollup', cacheStatsStart);
+  }
+}
+
+const DASHBOARD_PRICE_COLUMNS = [3, 4, 5, 6, 7, 11, 12, 13, 14, 15, 16, 18, 19];
+
+function dashboardRowKeys(rows) {
+  // Repeated (player, version) pairs are told apart by occurrence
+  const seen = {};
+  return rows.map(row => {
+    const baseKey = `${row[0]}|${row[1]}`;
+    seen[baseKey] = (seen[baseKey] || 0) + 1;
+    return seen[baseKey] === 1 ? baseKey : `${baseKey}#${seen[baseKey]}`;
+  });
+}
+
+// Sheets turns written "12.34%" text into 0.1234 and numeric text into numbers,
+// so read-back values are compared the way they would be stored
+function dashboardCellEquals(existing, next) {
+  if (existing === next) return true;
+  if (typeof existing === 'number') {
+    if (typeof next === 'number') return Math.abs(existing - next) < 1e-9;
+    const str = String(next).trim();
+    if (str === '') return false;
+    if (str.endsWith('%')) return Math.abs(existing - parseFloat(str) / 100) < 1e-9;
+    return Number(str) === existing;
+  }
+  if (typeof next === 'number') {
+    const str = String(existing).trim();
+    return str !== '' && Number(str) === next;
+  }
+  return String(existing) === String(next);
+}
+
+// Brings the Dashboard Analysis rows in line with newRows without a clear-and-rewrite:
+// rows whose (player, version) disappeared are deleted, surviving rows keep their
+// position and only their changed cell spans are written (contiguous rows grouped
+// into one block), and new players are appended at the bottom.
+function writeDashboardDiff(dashboardSheet, existingRows, newRows) {
+  const width = COLUMN_HEADERS.length;
+  const writer = createSheetWriteBatch(dashboardSheet);
+  const existingKeys = dashboardRowKeys(existingRows);
+  const newKeys = dashboardRowKeys(newRows);
+  const newByKey = {};
+  newKeys.forEach((key, i) => { newByKey[key] = newRows[i]; });
+  
+  if (existingRows.length === 0) {
+    writer.setValues(1, 1, [COLUMN_HEADERS]);
+  }
+  
+  // Delete vanished rows bottom-up so earlier row numbers stay valid
+  const survivors = [];
+  let removed = 0;
+  let runEnd = -1;
+  for (let i = existingRows.length - 1; i >= -1; i--) {
+    const vanished = i >= 0 && !Object.prototype.hasOwnProperty.call(newByKey, existingKeys[i]);
+    if (vanished) {
+      if (runEnd === -1) runEnd = i;
+      continue;
+    }
+    if (runEnd !== -1) {
+      dashboardSheet.deleteRows(i + 3, runEnd - i);
+      removed += runEnd - i;
+      runEnd = -1;
+    }
+    if (i >= 0) survivors.push(existingKeys[i]);
+  }
+  survivors.reverse();
+  if (removed > 0) invalidateSheetData(SHEETS.DASHBOARD);
+  const survivorRows = existingRows.filter((row, i) => Object.prototype.hasOwnProperty.call(newByKey, existingKeys[i]));
+  
+  let updated = 0;
+  let block = null;
+  const flushBlock = () => {
+    if (!block) return;
+    const values = block.rows.map(row => row.slice(block.minCol, block.maxCol + 1));
+    writer.setValues(block.start + 2, block.minCol + 1, values);
+    block = null;
+  };
+  for (let i = 0; i < survivors.length; i++) {
+    const oldRow = survivorRows[i];
+    const newRow = newByKey[survivors[i]];
+    let minCol = -1;
+    let maxCol = -1;
+    for (let col = 0; col < width; col++) {
+      const oldValue = oldRow[col] === undefined ? '' : oldRow[col];
+      if (!dashboardCellEquals(oldValue, newRow[col])) {
+        if (minCol === -1) minCol = col;
+        maxCol = col;
+      }
+    }
+    if (minCol === -1) {
+      flushBlock();
+      continue;
+    }
+    updated++;
+    if (block) {
+      block.minCol = Math.min(block.minCol, minCol);
+      block.maxCol = Math.max(block.maxCol, maxCol);
+      block.rows.push(newRow);
+    } else {
+      block = { start: i, minCol: minCol, maxCol: maxCol, rows: [newRow] };
+    }
+  }
+  flushBlock();
+  
+  const survivorSet = {};
+  survivors.forEach(key => { survivorSet[key] = true; });
+  const appended = newRows.filter((row, i) => !survivorSet[newKeys[i]]);
+  if (appended.length > 0) {
+    const startRow = survivors.length + 2;
+    writer.setValues(startRow, 1, appended);
+    DASHBOARD_PRICE_COLUMNS.forEach(col => writer.setNumberFormat(startRow, col, appended.length, 1, '#,##0'));
+  }
+  
+  writer.flush();
+  return { updated: updated, added: appended.length, removed: removed };
+}
+
+// Mode-independent inputs for one Manual Data Entry row; the caller has already
+// checked the player name
+function computePlayerStats(manualRow, playerHistory) {
+  const playerName = manualRow[0];
+  const version = manualRow[1] || '';
+  const currentPrice = parsePrice(manualRow[2]);
+  const todaysLowPoint = parsePrice(manualRow[3]);
+  const sixHAvg = parsePrice(manualRow[5]);
+  const high3H = parsePrice(manualRow[6]);
+  const high6H = parsePrice(manualRow[7]);
+  const high12H = parsePrice(manualRow[8]);
+  const high24H = parsePrice(manualRow[9]);
+  const movementPct = manualRow[10] || '';
+  
+  const historicalLow7D = playerHistory.low7D;
+  const historicalLow14D = playerHistory.low14D;
+  const prevLow8to14D = playerHistory.prevLow8to14D;
+  const historicalAvg3D = playerHistory.avg3D;
+  let historicalHigh7D = playerHistory.high7D;
+  
+  if (high24H > 0 && high24H > historicalHigh7D) {
+    historicalHigh7D = high24H;
+  }
+  
+  // FIXED: % From Low Point - ALWAYS uses Today's Low Point
+  let pctFromLowPoint = '';
+  if (todaysLowPoint > 0 && currentPrice > 0) {
+    pctFromLowPoint = (((currentPrice - todaysLowPoint) / todaysLowPoint) * 100).toFixed(2) + '%';
+  }
+  
+  // FIXED: % From Hist Low (7D) - ALWAYS uses Historical Low (7D)
+  let pctFromHistLow7D = '';
+  if (historicalLow7D > 0 && currentPrice > 0) {
+    const pct = ((currentPrice - historicalLow7D) / historicalLow7D) * 100;
+    pctFromHistLow7D = pct.toFixed(2) + '%';
+  }
+  
+  // FIXED: % From 14D Low - ALWAYS uses Prev Low to 7D Low (14D) which is the 8-14 day window
+  let pctFrom14DLow = '';
+  if (prevLow8to14D > 0 && currentPrice > 0) {
+    const pct = ((currentPrice - prevLow8to14D) / prevLow8to14D) * 100;
+    pctFrom14DLow = pct.toFixed(2) + '%';
+  }
+  
+  // FIXED: Show Prev Low to 7D Low for ALL modes (removed mode gate)
+  let prevLowTo7DLow = '';
+  if (prevLow8to14D > 0) {
+    prevLowTo7DLow = prevLow8to14D;
+  }
+  
+  return {
+    playerName: playerName,
+    version: version,
+    currentPrice: currentPrice,
+    todaysLowPoint: todaysLowPoint,
+    sixHAvg: sixHAvg,
+    high3H: high3H,
+    high6H: high6H,
+    high12H: high12H,
+    high24H: high24H,
+    movementPct: movementPct,
+    historicalAvg3D: historicalAvg3D,
+    historicalLow7D: historicalLow7D,
+    prevLowTo7DLow: prevLowTo7DLow,
+    historicalHigh7D: historicalHigh7D,
+    pctFromLowPoint: pctFromLowPoint,
+    pctFromHistLow7D: pctFromHistLow7D,
+    pctFrom14DLow: pctFrom14DLow
+  };
+}
+
+// ========================================
+// PRICING STRATEGIES
+// ========================================
+
+// Stats fields the strategies read, laid out as one Float64Array per field
+const PRICING_FIELDS = [
+  'currentPrice', 'todaysLowPoint', 'sixHAvg', 'high3H', 'high6H', 'high12H', 'high24H',
+  'historicalAvg3D', 'historicalLow7D', 'historicalHigh7D'
+];
+
+function buildPricingColumns(statsList) {
+  const count = statsList.length;
+  const columns = { count: count };
+  PRICING_FIELDS.forEach(field => {
+    const column = new Float64Array(count);
+    for (let i = 0; i < count; i++) {
+      column[i] = statsList[i][field] || 0;
+    }
+    columns[field] = column;
+  });
+  return columns;
+}
+
+// One strategy per dashboard mode. Each fills targetBuy[i] / targetSell[i] for every
+// player from the pricing columns; the minimum profitable sell and EA tax are applied
+// afterwards by priceAllPlayers, so a new mode only needs an entry here and in
+// DASHBOARD_MODES. Unknown modes price as normal.
+const PRICING_STRATEGIES = {
+  normal(c, targetBuy, targetSell) {
+    for (let i = 0; i < c.count; i++) {
+      const todaysLowPoint = c.todaysLowPoint[i];
+      const historicalLow7D = c.historicalLow7D[i];
+      const effectiveSupportLow = Math.min(
+        todaysLowPoint > 0 ? todaysLowPoint : Infinity,
+        historicalLow7D > 0 ? historicalLow7D : Infinity
+      );
+      if (effectiveSupportLow !== Infinity && effectiveSupportLow > 0) {
+        targetBuy[i] = roundToMarketPrice(effectiveSupportLow - 1000);
+      }
+      
+      if (c.high24H[i] > 0) {
+        targetSell[i] = roundToMarketPrice(c.high24H[i]);
+      } else if (c.high12H[i] > 0) {
+        targetSell[i] = roundToMarketPrice(c.high12H[i]);
+      }
+    }
+  },
+  
+  crash(c, targetBuy, targetSell) {
+    for (let i = 0; i < c.count; i++) {
+      const todaysLowPoint = c.todaysLowPoint[i];
+      const historicalLow7D = c.historicalLow7D[i];
+      if (todaysLowPoint > 0) {
+        if (historicalLow7D > 0 && historicalLow7D < todaysLowPoint) {
+          const avgLow = (historicalLow7D + todaysLowPoint) / 2;
+          targetBuy[i] = roundToMarketPrice(avgLow - Math.max(500, avgLow * 0.01));
         } else {
-          const effectiveSupportLow = Math.min(
-            todaysLowPoint > 0 ? todaysLowPoint : Infinity,
-            historicalLow7D > 0 ? historicalLow7D : Infinity
-          );
-          
-          if (effectiveSupportLow !== Infinity && effectiveSupportLow > 0) {
-            targetBuy = effectiveSupportLow - 1000;
-            targetBuy = roundToMarketPrice(targetBuy);
-          }
-          
-          if (high24H > 0) {
-            targetSell = high24H;
-            targetSell = roundToMarketPrice(targetSell);
-          } else if (high12H > 0) {
-            targetSell = high12H;
-            targetSell = roundToMarketPrice(targetSell);
-          }
+          targetBuy[i] = roundToMarketPrice(todaysLowPoint - Math.max(500, todaysLowPoint * 0.01));
         }
-        
-        if (targetBuy > 0) {
-          const minProfitableSell = (targetBuy + 1000) / 0.95;
-          const roundedMinSell = roundUpToMarketPrice(minProfitableSell);
-          if (targetSell === 0 || targetSell < roundedMinSell) {
-            targetSell = roundedMinSell;
-          }
-        }
-        
-        let netProfitPct = '';
-        let targetSellDisplay = targetSell;
-        if (targetBuy > 0 && targetSell > 0) {
-          const grossProfit = targetSell - targetBuy;
-          const eaTax = targetSell * 0.05;
-          const netProfit = grossProfit - eaTax;
-          const netProfitPercentage = (netProfit / targetBuy) * 100;
-          netProfitPct = netProfitPercentage.toFixed(2) + '%';
-          if (netProfitPercentage > 4) {
-            targetSellDisplay = targetSell + ' 🔥';
+      } else if (c.currentPrice[i] > 0) {
+        targetBuy[i] = roundToMarketPrice(c.currentPrice[i] - 500);
+      }
+      
+      const sixHAvg = c.sixHAvg[i];
+      const high6H = c.high6H[i];
+      if (sixHAvg > 0 || high6H > 0) {
+        targetSell[i] = roundToMarketPrice(Math.max(sixHAvg > 0 ? sixHAvg : 0, high6H > 0 ? high6H : 0));
+      }
+    }
+  },
+  
+  rise(c, targetBuy, targetSell) {
+    for (let i = 0; i < c.count; i++) {
+      const currentPrice = c.currentPrice[i];
+      const high24H = c.high24H[i];
+      const historicalAvg3D = c.historicalAvg3D[i];
+      const historicalHigh7D = c.historicalHigh7D[i];
+      if (currentPrice > 0 && high24H > 0) {
+        if (currentPrice >= high24H * 0.98) {
+          const safetyFloor = Math.max(c.todaysLowPoint[i], historicalAvg3D > 0 ? historicalAvg3D * 0.99 : 0);
+          if (safetyFloor > 0) {
+            targetBuy[i] = roundDownToMarketPrice(safetyFloor);
           }
+        } else {
+          targetBuy[i] = roundDownToMarketPrice(currentPrice * 0.98);
         }
-        
-        const dashboardRow = [
-          playerName,
-          version,
-          currentPrice,
-          historicalAvg3D,
-          historicalLow7D,
-          prevLowTo7DLow,
-          todaysLowPoint,
-          pctFromLowPoint,
-          pctFromHistLow7D,
-          pctFrom14DLow,
-          sixHAvg,
-          high3H,
-          high6H,
-          high12H,
-          high24H,
-          historicalHigh7D,
-          movementPct,
-          targetBuy,
-          targetSellDisplay,
-          netProfitPct
-        ];
-        
-        dashboardRows.push(dashboardRow);
+      }
+      
+      if (historicalHigh7D > 0 && high24H > 0 && historicalAvg3D > 0) {
+        const weightedAvg = (historicalHigh7D * 0.4) + (high24H * 0.4) + (historicalAvg3D * 0.2);
+        targetSell[i] = roundToMarketPrice(weightedAvg * 1.02);
+      } else if (historicalHigh7D > 0 || high24H > 0) {
+        targetSell[i] = roundToMarketPrice(Math.max(historicalHigh7D, high24H) * 0.98);
+      }
+    }
+  },
+  
+  investments(c, targetBuy, targetSell) {
+    for (let i = 0; i < c.count; i++) {
+      const todaysLowPoint = c.todaysLowPoint[i];
+      const high6H = c.high6H[i];
+      if (high6H > 0) {
+        targetBuy[i] = roundToMarketPrice(high6H / 1.1025);
+      } else if (todaysLowPoint > 0) {
+        targetBuy[i] = roundToMarketPrice(todaysLowPoint - Math.max(500, todaysLowPoint * 0.01));
+      }
+      
+      // Take-my-trade average of whichever of 6H avg, 3H high and 6H high are known
+      let tmtSum = 0;
+      let tmtCount = 0;
+      if (c.sixHAvg[i] > 0) { tmtSum += c.sixHAvg[i]; tmtCount++; }
+      if (c.high3H[i] > 0) { tmtSum += c.high3H[i]; tmtCount++; }
+      if (high6H > 0) { tmtSum += high6H; tmtCount++; }
+      if (tmtCount > 0) {
+        targetSell[i] = roundToMarketPrice(tmtSum / tmtCount);
+      }
+    }
+  }
+};
+
+// Runs one mode's strategy over every player, then lifts each sell to the minimum
+// profitable price and works out net profit after the 5% EA tax
+function priceAllPlayers(mode, columns) {
+  const count = columns.count;
+  const targetBuy = new Float64Array(count);
+  const targetSell = new Float64Array(count);
+  (PRICING_STRATEGIES[mode] || PRICING_STRATEGIES.normal)(columns, targetBuy, targetSell);
+  
+  for (let i = 0; i < count; i++) {
+    if (targetBuy[i] > 0) {
+      const roundedMinSell = roundUpToMarketPrice((targetBuy[i] + 1000) / 0.95);
+      if (targetSell[i] === 0 || targetSell[i] < roundedMinSell) {
+        targetSell[i] = roundedMinSell;
+      }
+    }
+  }
+  
+  const targetSellDisplay = new Array(count);
+  const netProfitPct = new Array(count);
+  for (let i = 0; i < count; i++) {
+    targetSellDisplay[i] = targetSell[i];
+    netProfitPct[i] = '';
+    if (targetBuy[i] > 0 && targetSell[i] > 0) {
+      const netProfit = targetSell[i] - targetBuy[i] - targetSell[i] * 0.05;
+      const netProfitPercentage = (netProfit / targetBuy[i]) * 100;
+      netProfitPct[i] = netProfitPercentage.toFixed(2) + '%';
+      if (netProfitPercentage > 4) {
+        targetSellDisplay[i] = targetSell[i] + ' 🔥';
+      }
+    }
+  }
+  
+  return { targetBuy: targetBuy, targetSellDisplay: targetSellDisplay, netProfitPct: netProfitPct };
+}
+
+function assembleDashboardRow(stats, priced, i) {
+  return [
+    stats.playerName,
+    stats.version,
+    stats.currentPrice,
+    stats.historicalAvg3D,
+    stats.historicalLow7D,
+    stats.prevLowTo7DLow,
+    stats.todaysLowPoint,
+    stats.pctFromLowPoint,
+    stats.pctFromHistLow7D,
+    stats.pctFrom14DLow,
+    stats.sixHAvg,
+    stats.high3H,
+    stats.high6H,
+    stats.high12H,
+    stats.high24H,
+    stats.historicalHigh7D,
+    stats.movementPct,
+    priced.targetBuy[i],
+    priced.targetSellDisplay[i],
+    priced.netProfitPct[i]
+  ];
+}
+
+// Prices every player in every mode from one set of history stats. Returns the
+// dashboard rows for the active mode and the Dashboard Modes rows:
+// [player, version, then Target Buy, Target Sell (List), Net Profit % per mode]
+function priceDashboardRows(statsList, mode) {
+  const columns = buildPricingColumns(statsList);
+  const pricedByMode = {};
+  DASHBOARD_MODES.forEach(m => { pricedByMode[m] = priceAllPlayers(m, columns); });
+  const active = pricedByMode[mode] || priceAllPlayers(mode, columns);
+  
+  const dashboardRows = statsList.map((stats, i) => assembleDashboardRow(stats, active, i));
+  const modeRows = statsList.map((stats, i) => {
+    const modeRow = [stats.playerName, stats.version];
+    DASHBOARD_MODES.forEach(m => {
+      const priced = pricedByMode[m];
+      modeRow.push(priced.targetBuy[i], priced.targetSellDisplay[i], priced.netProfitPct[i]);
+    });
+    return modeRow;
+  });
+  return { dashboardRows: dashboardRows, modeRows: modeRows };
+}
+
+function buildDashboardWithMode(mode) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const ss = getSpreadsheet();
+    const dashboardSheet = ss.getSheetByName(SHEETS.DASHBOARD);
+    
+    if (!dashboardSheet) {
+      return { success: false, message: 'Dashboard Analysis sheet not found' };
+    }
+    
+    // A full build covers every edit made before Manual Data Entry is read
+    deleteChunkedProperty(DIRTY_PLAYERS_PROPERTY);
+    const manualData = getSheetData(SHEETS.MANUAL);
+    const existingDashboard = getSheetData(SHEETS.DASHBOARD);
+    
+    if (manualData.length === 0) {
+      return { success: false, message: 'No data in Manual Data Entry sheet' };
+    }
+    
+    const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
+    const today = toEpochDay(new Date());
+    const fingerprint = dashboardBuildFingerprint(manualData, mode, today);
+    if (isUnchangedBuild(DASHBOARD_FINGERPRINT_PROPERTY, fingerprint, existingDashboard)) {
+      return {
+        success: true,
+        message: `Dashboard already up to date in ${modeText} Mode with ${existingDashboard.length} players (inputs unchanged, rewrite skipped)`
+      };
+    }
+    
+    // History stats are mode-independent, so every mode is priced from one pass
+    const statsList = computeStatsForRows(manualData, 0, today);
+    const { dashboardRows, modeRows } = priceDashboardRows(statsList, mode);
+    return commitDashboardRows(dashboardSheet, existingDashboard, mode, fingerprint, dashboardRows, modeRows);
+    
+  } catch (e) {
+    Logger.log(`Error in buildDashboardWithMode: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('buildDashboardWithMode', cacheStatsStart);
+  }
+}
+
+// Player stats for the named rows of a Manual Data Entry slice; firstRow is the
+// slice's offset, used only in log messages
+function computeStatsForRows(manualRows, firstRow, today) {
+  const statsList = [];
+  const playerHistories = loadPlayerHistories(manualRows, getHistoryWindow(today));
+  
+  for (let i = 0; i < manualRows.length; i++) {
+    try {
+      const manualRow = manualRows[i];
+      const playerName = manualRow[0];
+      if (!playerName) continue;
+      
+      statsList.push(computePlayerStats(manualRow, playerHistories[`${playerName}|${manualRow[1] || ''}`]));
+    } catch (e) {
+      Logger.log(`Error processing player row ${firstRow + i}: ${e.toString()}`);
+      continue;
+    }
+  }
+  return statsList;
+}
+
+// Swaps freshly priced rows into Dashboard Analysis and Dashboard Modes and records
+// the build; shared by the one-shot and sharded builds
+function commitDashboardRows(dashboardSheet, existingDashboard, mode, fingerprint, dashboardRows, modeRows) {
+  const diff = writeDashboardDiff(dashboardSheet, existingDashboard, dashboardRows);
+  writeModeTargets(modeRows);
+  
+  if (dashboardRows.length === 0) {
+    return { success: false, message: 'No valid dashboard rows generated' };
+  }
+  
+  PropertiesService.getScriptProperties().setProperty(DASHBOARD_MODE_PROPERTY, mode);
+  saveBuildFingerprint(DASHBOARD_FINGERPRINT_PROPERTY, fingerprint, dashboardRows.length);
+  clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
+  const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
+  return { 
+    success: true, 
+    message: `Dashboard built in ${modeText} Mode with ${dashboardRows.length} players (${diff.updated} updated, ${diff.added} added, ${diff.removed} removed)` 
+  };
+}
+
+// ========================================
+// SHARDED BUILDS (PARALLEL WEB UI CALLS)
+// ========================================
+
+// The web UI prices Manual Data Entry row ranges in parallel google.script.run
+// calls and hands the merged rows to commitDashboardShards in one final call
+const MIN_SHARD_PLAYERS = 25;
+
+// Edits are only taken off the dirty list once the merged rows are committed, so a
+// failed or abandoned sharded build leaves them for recomputeDirtyPlayers
+function getDashboardShardPlan(mode, shardCount) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const manualData = getSheetData(SHEETS.MANUAL);
+    const existingDashboard = getSheetData(SHEETS.DASHBOARD);
+    if (manualData.length === 0) {
+      return { success: false, message: 'No data in Manual Data Entry sheet' };
+    }
+    
+    const today = toEpochDay(new Date());
+    const fingerprint = dashboardBuildFingerprint(manualData, mode, today);
+    if (isUnchangedBuild(DASHBOARD_FINGERPRINT_PROPERTY, fingerprint, existingDashboard)) {
+      clearDirtyPlayersIfUnchanged(mode, fingerprint);
+      const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
+      return {
+        success: true,
+        upToDate: true,
+        message: `Dashboard already up to date in ${modeText} Mode with ${existingDashboard.length} players (inputs unchanged, rewrite skipped)`
+      };
+    }
+    
+    const total = manualData.length;
+    const count = Math.max(1, Math.min(shardCount || 1, Math.ceil(total / MIN_SHARD_PLAYERS)));
+    const size = Math.ceil(total / count);
+    const shards = [];
+    for (let start = 0; start < total; start += size) {
+      shards.push([start, Math.min(start + size, total)]);
+    }
+    return { success: true, upToDate: false, fingerprint: fingerprint, today: today, shards: shards };
+  } catch (e) {
+    Logger.log(`Error in getDashboardShardPlan: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('getDashboardShardPlan', cacheStatsStart);
+  }
+}
+
+// Prices Manual Data Entry rows [start, end) in every mode without writing anything.
+// The ranges come from the plan's read, so a shard refuses to run once the inputs
+// no longer hash to the plan's fingerprint (rows could have shifted between shards).
+function buildDashboardShard(mode, start, end, today, fingerprint) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const manualData = getSheetData(SHEETS.MANUAL);
+    if (dashboardBuildFingerprint(manualData, mode, today) !== fingerprint) {
+      return { success: false, message: 'Manual Data Entry or the archive changed during the rebuild; please rebuild again' };
+    }
+    const statsList = computeStatsForRows(manualData.slice(start, end), start, today);
+    const priced = priceDashboardRows(statsList, mode);
+    return { success: true, start: start, dashboardRows: priced.dashboardRows, modeRows: priced.modeRows };
+  } catch (e) {
+    Logger.log(`Error in buildDashboardShard: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('buildDashboardShard', cacheStatsStart);
+  }
+}
+
+// Empties the dirty list when Manual Data Entry still hashes to fingerprint, i.e.
+// every pending edit is in the rows just written. Checked under the lock
+// markPlayersDirty takes, so an edit cannot land between the check and the delete.
+function clearDirtyPlayersIfUnchanged(mode, fingerprint) {
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    invalidateSheetData(SHEETS.MANUAL);
+    const manualData = getSheetData(SHEETS.MANUAL);
+    if (dashboardBuildFingerprint(manualData, mode, toEpochDay(new Date())) === fingerprint) {
+      deleteChunkedProperty(DIRTY_PLAYERS_PROPERTY);
+    }
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+// Writes the merged shard rows (in Manual Data Entry order) in one diff write
+function commitDashboardShards(mode, fingerprint, dashboardRows, modeRows) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const dashboardSheet = getSpreadsheet().getSheetByName(SHEETS.DASHBOARD);
+    if (!dashboardSheet) {
+      return { success: false, message: 'Dashboard Analysis sheet not found' };
+    }
+    const existingDashboard = getSheetData(SHEETS.DASHBOARD);
+    const result = commitDashboardRows(dashboardSheet, existingDashboard, mode, fingerprint, dashboardRows, modeRows);
+    if (result.success) clearDirtyPlayersIfUnchanged(mode, fingerprint);
+    return result;
+  } catch (e) {
+    Logger.log(`Error in commitDashboardShards: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('commitDashboardShards', cacheStatsStart);
+  }
+}
+
+// ========================================
+// INCREMENTAL RECOMPUTE (EDITED PLAYERS)
+// ========================================
+
+// The dirty set is a JSON list of "player|version" keys in chunked script
+// properties. Past MAX_DIRTY_PLAYERS keys, or after an edit whose effect on the
+// keys is unknown, it collapses to [FULL_REBUILD_KEY] and the next recompute runs
+// a full build instead.
+const DIRTY_PLAYERS_PROPERTY = 'DIRTY_PLAYERS';
+const MAX_DIRTY_PLAYERS = 150;
+const FULL_REBUILD_KEY = '*';
+const DASHBOARD_MODE_PROPERTY = 'DASHBOARD_MODE';
+
+function installDirtyRowTrigger() {
+  ScriptApp.getProjectTriggers()
+    .filter(trigger => trigger.getHandlerFunction() === 'onManualDataEdit')
+    .forEach(trigger => ScriptApp.deleteTrigger(trigger));
+  ScriptApp.newTrigger('onManualDataEdit').forSpreadsheet(getSpreadsheet()).onEdit().create();
+  return { success: true, message: 'Manual Data Entry edits are now tracked for incremental recompute' };
+}
+
+// Installable onEdit handler: records the (player, version) of every edited row.
+// Renaming or clearing a single name/version cell also marks the old key, so its
+// dashboard row is dropped; a multi-cell edit touching those columns could have
+// changed any key, so it asks for a full rebuild.
+function onManualDataEdit(e) {
+  try {
+    if (!e || !e.range) {
+      markPlayersDirty([FULL_REBUILD_KEY]);
+      return;
+    }
+    const sheet = e.range.getSheet();
+    if (sheet.getName() !== SHEETS.MANUAL) return;
+    
+    const startRow = Math.max(e.range.getRow(), 2);
+    const endRow = e.range.getRow() + e.range.getNumRows() - 1;
+    if (endRow < startRow) return;
+    
+    const firstCol = e.range.getColumn();
+    const touchesKeys = firstCol <= 2;
+    const singleCell = e.range.getNumRows() === 1 && e.range.getNumColumns() === 1;
+    if (touchesKeys && !singleCell) {
+      markPlayersDirty([FULL_REBUILD_KEY]);
+      return;
+    }
+    
+    const rows = sheet.getRange(startRow, 1, endRow - startRow + 1, 2).getValues();
+    const keys = rows
+      .filter(row => row[0])
+      .map(row => `${row[0]}|${row[1] || ''}`);
+    // oldValue is undefined when the cell was empty before the edit
+    if (touchesKeys && e.oldValue !== undefined && e.oldValue !== '') {
+      const oldKey = firstCol === 1 ? `${e.oldValue}|${rows[0][1] || ''}` : (rows[0][0] ? `${rows[0][0]}|${e.oldValue}` : null);
+      if (oldKey) keys.push(oldKey);
+    }
+    markPlayersDirty(keys);
+  } catch (err) {
+    Logger.log(`Error in onManualDataEdit: ${err.toString()}`);
+  }
+}
+
+function readDirtyPlayers() {
+  return JSON.parse(getChunkedProperty(DIRTY_PLAYERS_PROPERTY) || '[]');
+}
+
+function markPlayersDirty(keys) {
+  if (keys.length === 0) return;
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    let merged = Array.from(new Set(readDirtyPlayers().concat(keys)));
+    if (merged.includes(FULL_REBUILD_KEY) || merged.length > MAX_DIRTY_PLAYERS) {
+      merged = [FULL_REBUILD_KEY];
+    }
+    putChunkedProperty(DIRTY_PLAYERS_PROPERTY, JSON.stringify(merged));
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+function takeDirtyPlayers() {
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    const dirty = readDirtyPlayers();
+    deleteChunkedProperty(DIRTY_PLAYERS_PROPERTY);
+    return dirty;
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+// Re-prices only the players edited since the last build and patches their
+// dashboard rows in place, using the mode of the last full build
+function recomputeDirtyPlayers() {
+  const cacheStatsStart = getSheetCacheStats();
+  let dirtyKeys = [];
+  try {
+    const dashboardSheet = getSpreadsheet().getSheetByName(SHEETS.DASHBOARD);
+    if (!dashboardSheet) {
+      return { success: false, message: 'Dashboard Analysis sheet not found' };
+    }
+    
+    dirtyKeys = takeDirtyPlayers();
+    const mode = PropertiesService.getScriptProperties().getProperty(DASHBOARD_MODE_PROPERTY) || 'normal';
+    if (dirtyKeys.includes(FULL_REBUILD_KEY)) {
+      const result = buildDashboardWithMode(mode);
+      if (!result.success) markPlayersDirty(dirtyKeys);
+      return result;
+    }
+    
+    const [manualData, existingDashboard, existingModeRows] = getSheetDataBatch([
+      SHEETS.MANUAL,
+      SHEETS.DASHBOARD,
+      SHEETS.DASHBOARD_MODES
+    ]);
+    // Rows deleted from Manual Data Entry fire no edit event; their dashboard rows
+    // are found here and dropped with the dirty ones
+    const manualKeys = new Set(manualData.filter(row => row[0]).map(row => `${row[0]}|${row[1] || ''}`));
+    const removedKeys = existingDashboard
+      .map(row => `${row[0]}|${row[1] || ''}`)
+      .filter(key => !manualKeys.has(key));
+    if (dirtyKeys.length === 0 && removedKeys.length === 0) {
+      return { success: true, message: 'No edited players to recompute' };
+    }
+    const dirtySet = new Set(dirtyKeys.concat(removedKeys));
+    const dirtyManualRows = manualData.filter(row => row[0] && dirtySet.has(`${row[0]}|${row[1] || ''}`));
+    
+    const playerHistories = loadPlayerHistories(dirtyManualRows, getHistoryWindow(toEpochDay(new Date())));
+    
+    const statsList = [];
+    dirtyManualRows.forEach(manualRow => {
+      try {
+        statsList.push(computePlayerStats(manualRow, playerHistories[`${manualRow[0]}|${manualRow[1] || ''}`]));
       } catch (e) {
-        Logger.log(`Error processing player row ${i}: ${e.toString()}`);
-        continue;
+        Logger.log(`Error recomputing ${manualRow[0]}|${manualRow[1] || ''}: ${e.toString()}`);
       }
+    });
+    
+    const { dashboardRows, modeRows } = priceDashboardRows(statsList, mode);
+    const recomputed = {};
+    const recomputedModes = {};
+    statsList.forEach((stats, i) => {
+      const key = `${stats.playerName}|${stats.version}`;
+      if (!recomputed[key]) recomputed[key] = [];
+      if (!recomputedModes[key]) recomputedModes[key] = [];
+      recomputed[key].push(dashboardRows[i]);
+      recomputedModes[key].push(modeRows[i]);
+    });
+    
+    const patchedRows = patchDirtyRows(existingDashboard, dirtySet, recomputed);
+    PropertiesService.getScriptProperties().deleteProperty(DASHBOARD_FINGERPRINT_PROPERTY);
+    const diff = writeDashboardDiff(dashboardSheet, existingDashboard, patchedRows);
+    writeModeTargets(patchDirtyRows(existingModeRows, dirtySet, recomputedModes));
+    clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
+    const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
+    return { 
+      success: true, 
+      message: `Recomputed ${dirtySet.size} edited or removed players in ${modeText} Mode (${diff.updated} updated, ${diff.added} added, ${diff.removed} removed)` 
+    };
+  } catch (e) {
+    // Put the keys back so the next recompute retries them
+    markPlayersDirty(dirtyKeys);
+    Logger.log(`Error in recomputeDirtyPlayers: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('recomputeDirtyPlayers', cacheStatsStart);
+  }
+}
+
+// Dirty players keep their slot; ones no longer in Manual Data Entry drop out and
+// new ones are appended. Consumes the row lists in recomputed.
+function patchDirtyRows(existingRows, dirtySet, recomputed) {
+  const patchedRows = [];
+  existingRows.forEach(row => {
+    const key = `${row[0]}|${row[1] || ''}`;
+    if (!dirtySet.has(key)) {
+      patchedRows.push(row);
+    } else if (recomputed[key] && recomputed[key].length > 0) {
+      patchedRows.push(recomputed[key].shift());
+    }
+  });
+  Object.keys(recomputed).forEach(key => {
+    recomputed[key].forEach(row => patchedRows.push(row));
+  });
+  return patchedRows;
+}
+
+// ========================================
+// ALL-MODE TARGETS (INSTANT MODE SWITCH)
+// ========================================
+
+// Every build also stores the targets of all four modes on the Dashboard Modes
+// sheet, so switching mode is a column swap instead of a rebuild
+function writeModeTargets(modeRows) {
+  const ss = getSpreadsheet();
+  let modesSheet = ss.getSheetByName(SHEETS.DASHBOARD_MODES);
+  if (!modesSheet) {
+    modesSheet = ss.insertSheet(SHEETS.DASHBOARD_MODES);
+  }
+  
+  const width = MODE_TARGET_HEADERS.length;
+  const writer = createSheetWriteBatch(modesSheet);
+  writer.clear(2, 1, modesSheet.getLastRow() - 1, width);
+  writer.setValues(1, 1, [MODE_TARGET_HEADERS].concat(modeRows));
+  if (modeRows.length > 0) {
+    DASHBOARD_MODES.forEach((mode, m) => {
+      writer.setNumberFormat(2, 3 + m * 3, modeRows.length, 2, '#,##0');
+    });
+  }
+  writer.flush();
+}
+
+// Lines the stored targets up with the dashboard rows: { mode: [[buy, sell, net], ...] }
+// in dashboard row order, or null when any dashboard row has no stored targets
+function alignModeTargets(dashboardRows, modeRows) {
+  const modeRowsByKey = {};
+  dashboardRowKeys(modeRows).forEach((key, i) => { modeRowsByKey[key] = modeRows[i]; });
+  const dashboardKeys = dashboardRowKeys(dashboardRows);
+  if (!dashboardKeys.every(key => modeRowsByKey[key])) return null;
+  
+  const aligned = {};
+  DASHBOARD_MODES.forEach((mode, m) => {
+    aligned[mode] = dashboardKeys.map(key => modeRowsByKey[key].slice(2 + m * 3, 5 + m * 3));
+  });
+  return aligned;
+}
+
+// Swaps the Target Buy / Target Sell / Net Profit columns to a stored mode without
+// re-reading the archive; falls back to a full build when nothing is stored yet
+function setDashboardMode(mode) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    if (DASHBOARD_MODES.indexOf(mode) === -1) {
+      return { success: false, message: `Unknown dashboard mode: ${mode}` };
     }
-    
-    if (dashboardRows.length === 0) {
-      return { success: false, message: 'No valid dashboard rows generated' };
+    const dashboardSheet = getSpreadsheet().getSheetByName(SHEETS.DASHBOARD);
+    if (!dashboardSheet) {
+      return { success: false, message: 'Dashboard Analysis sheet not found' };
     }
     
-    dashboardSheet.getRange(2, 1, dashboardRows.length, dashboardRows[0].length).setValues(dashboardRows);
-    
-    const priceColumns = [3, 4, 5, 6, 7, 11, 12, 13, 14, 15, 16, 18, 19];
-    for (let col of priceColumns) {
-      dashboardSheet.getRange(2, col, dashboardRows.length, 1).setNumberFormat('#,##0');
+    const [existingDashboard, modeRows] = getSheetDataBatch([SHEETS.DASHBOARD, SHEETS.DASHBOARD_MODES]);
+    const modeTargets = alignModeTargets(existingDashboard, modeRows);
+    if (existingDashboard.length === 0 || !modeTargets) {
+      return buildDashboardWithMode(mode);
     }
     
+    const targetCol = COLUMN_HEADERS.indexOf('Target Buy');
+    const switchedRows = existingDashboard.map((row, i) => 
+      row.slice(0, targetCol).concat(modeTargets[mode][i]));
+    PropertiesService.getScriptProperties().deleteProperty(DASHBOARD_FINGERPRINT_PROPERTY);
+    const diff = writeDashboardDiff(dashboardSheet, existingDashboard, switchedRows);
+    clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
+    
+    PropertiesService.getScriptProperties().setProperty(DASHBOARD_MODE_PROPERTY, mode);
     const modeText = mode.charAt(0).toUpperCase() + mode.slice(1);
     return { 
       success: true, 
-      message: `Dashboard built in ${modeText} Mode with ${dashboardRows.length} players` 
+      message: `Dashboard switched to ${modeText} Mode (${diff.updated} rows updated)` 
     };
-    
   } catch (e) {
-    Logger.log(`Error in buildDashboardWithMode: ${e.toString()}`);
+    Logger.log(`Error in setDashboardMode: ${e.toString()}`);
     return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('setDashboardMode', cacheStatsStart);
   }
 }
 
-function getDashboardData() {
+function readDashboardPayload() {
+  const [dashboardData, manualData, modeRows] = getSheetDataBatch([
+    SHEETS.DASHBOARD,
+    SHEETS.MANUAL,
+    SHEETS.DASHBOARD_MODES,
+    { sheetName: SHEETS.PREFERENCES, numHeaders: 0 }
+  ]);
+  const visibleColumns = loadPreferences();
+  const headers = COLUMN_HEADERS;
+  const crashMode = detectMarketCrash(manualData);
+  return {
+    dashboardData: dashboardData,
+    headers: headers,
+    visibleColumns: visibleColumns,
+    crashMode: crashMode,
+    modeTargets: alignModeTargets(dashboardData, modeRows),
+    activeMode: PropertiesService.getScriptProperties().getProperty(DASHBOARD_MODE_PROPERTY) || 'normal'
+  };
+}
+
+// knownVersion is the version stamp of the payload the caller already holds
+function getDashboardData(knownVersion) {
+  const cacheStatsStart = getSheetCacheStats();
   try {
-    const dashboardData = getSheetData(SHEETS.DASHBOARD, 1);
-    const manualData = getSheetData(SHEETS.MANUAL, 1);
-    const visibleColumns = loadPreferences();
-    const headers = COLUMN_HEADERS;
-    const crashMode = detectMarketCrash(manualData);
-    return {
-      dashboardData: dashboardData,
-      headers: headers,
-      visibleColumns: visibleColumns,
-      crashMode: crashMode
-    };
+    return serveSnapshot(DASHBOARD_SNAPSHOT_KEY, readDashboardPayload, knownVersion);
   } catch (e) {
     Logger.log(`Error in getDashboardData: ${e.toString()}`);
     return {
       error: `Failed to load dashboard data: ${e.message}`,
       details: e.toString()
     };
+  } finally {
+    logSheetCacheStats('getDashboardData', cacheStatsStart);
+  }
+}
+
+// Column indexes the web UI renders as percentages
+const DASHBOARD_PERCENT_COLUMN_INDEXES = [7, 8, 9, 19];
+const DASHBOARD_QUERY_DEFAULT_LIMIT = 100;
+const DASHBOARD_QUERY_MAX_LIMIT = 500;
+
+// Same text the web UI shows for a cell, so server search matches what users see
+function dashboardCellText(value, colIndex) {
+  if (value === 0 || value === '' || value === null || value === undefined) return '';
+  const str = String(value).trim();
+  if (DASHBOARD_PERCENT_COLUMN_INDEXES.indexOf(colIndex) === -1 || str.endsWith('%')) return str;
+  const num = parseFloat(str);
+  if (isNaN(num)) return str;
+  return (num >= -1 && num <= 1 ? num * 100 : num).toFixed(2) + '%';
+}
+
+// Numbers (ignoring thousands separators, % and 🔥) compare numerically, anything
+// else case-insensitively, matching the web UI column sort
+function compareDashboardValues(a, b) {
+  const numA = parseFloat(String(a).replace(/[,%🔥]/g, ''));
+  const numB = parseFloat(String(b).replace(/[,%🔥]/g, ''));
+  if (!isNaN(numA) && !isNaN(numB)) return numA - numB;
+  const strA = String(a).toLowerCase();
+  const strB = String(b).toLowerCase();
+  if (strA < strB) return -1;
+  if (strA > strB) return 1;
+  return 0;
+}
+
+// One page of the dashboard, projected to the requested columns. query:
+// { columns, sortColumn, sortDirection: 'asc' | 'desc', search, offset, limit }.
+// columns defaults to the saved preferences; search matches any projected cell.
+function queryDashboardData(query) {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    query = query || {};
+    const payload = serveSnapshot(DASHBOARD_SNAPSHOT_KEY, readDashboardPayload);
+    const width = COLUMN_HEADERS.length;
+    const columns = (Array.isArray(query.columns) ? query.columns : payload.visibleColumns)
+      .map(Number)
+      .filter(col => Number.isInteger(col) && col >= 0 && col < width);
+    
+    let rows = payload.dashboardData;
+    const search = String(query.search || '').trim().toUpperCase();
+    if (search) {
+      rows = rows.filter(row => columns.some(col => dashboardCellText(row[col], col).toUpperCase().indexOf(search) > -1));
+    }
+    
+    const sortColumn = Number(query.sortColumn);
+    if (query.sortColumn !== undefined && query.sortColumn !== null && Number.isInteger(sortColumn) &&
+        sortColumn >= 0 && sortColumn < width) {
+      const direction = query.sortDirection === 'desc' ? -1 : 1;
+      rows = rows.slice().sort((a, b) => direction * compareDashboardValues(a[sortColumn], b[sortColumn]));
+    }
+    
+    const offset = Math.max(0, parseInt(query.offset, 10) || 0);
+    const limit = Math.min(DASHBOARD_QUERY_MAX_LIMIT, Math.max(1, parseInt(query.limit, 10) || DASHBOARD_QUERY_DEFAULT_LIMIT));
+    return {
+      headers: columns.map(col => COLUMN_HEADERS[col]),
+      columns: columns,
+      rows: rows.slice(offset, offset + limit).map(row => columns.map(col => row[col])),
+      totalRows: rows.length,
+      offset: offset,
+      limit: limit,
+      crashMode: payload.crashMode,
+      activeMode: payload.activeMode,
+      snapshotAgeSeconds: payload.snapshotAgeSeconds
+    };
+  } catch (e) {
+    Logger.log(`Error in queryDashboardData: ${e.toString()}`);
+    return {
+      error: `Failed to query dashboard data: ${e.message}`,
+      details: e.toString()
+    };
+  } finally {
+    logSheetCacheStats('queryDashboardData', cacheStatsStart);
   }
 }
 
@@ -710,29 +2299,41 @@ function getDashboardData() {
 // CHEM STYLES AREA (FIXED COLUMN MAPPING)
 // ========================================
 
+// Loaded once per execution; addToBlacklist keeps it in step with its own writes
+let blacklistIndexCache = null;
+
+function loadBlacklistIndex() {
+  if (blacklistIndexCache) return blacklistIndexCache;
+  const index = new Map();
+  const blacklistData = getSheetData(SHEETS.CHEM_BLACKLIST, 1);
+  
+  for (let i = 0; i < blacklistData.length; i++) {
+    const row = blacklistData[i];
+    const blPlayerName = (row[1] || '').toString().trim();
+    if (!blPlayerName || index.has(blPlayerName)) continue;
+    
+    index.set(blPlayerName, {
+      rowNum: i + 2,
+      fullBlacklist: (row[10] || '').toString().toUpperCase() === 'Y',
+      hunterSkip: (row[11] || '').toString().toUpperCase() === 'Y',
+      shadowSkip: (row[12] || '').toString().toUpperCase() === 'Y'
+    });
+  }
+  
+  blacklistIndexCache = index;
+  return index;
+}
+
 function checkBlacklist(playerName) {
   try {
-    const blacklistData = getSheetData(SHEETS.CHEM_BLACKLIST, 1);
-    if (blacklistData.length === 0) return { fullBlacklist: false, hunterSkip: false, shadowSkip: false };
-    
-    for (let i = 0; i < blacklistData.length; i++) {
-      const row = blacklistData[i];
-      const blPlayerName = (row[1] || '').toString().trim();
-      
-      if (blPlayerName === playerName) {
-        const fullBlacklist = (row[10] || '').toString().toUpperCase() === 'Y';
-        const hunterSkip = (row[11] || '').toString().toUpperCase() === 'Y';
-        const shadowSkip = (row[12] || '').toString().toUpperCase() === 'Y';
-        
-        return {
-          fullBlacklist: fullBlacklist,
-          hunterSkip: hunterSkip,
-          shadowSkip: shadowSkip
-        };
-      }
-    }
+    const entry = loadBlacklistIndex().get(playerName);
+    if (!entry) return { fullBlacklist: false, hunterSkip: false, shadowSkip: false };
     
-    return { fullBlacklist: false, hunterSkip: false, shadowSkip: false };
+    return {
+      fullBlacklist: entry.fullBlacklist,
+      hunterSkip: entry.hunterSkip,
+      shadowSkip: entry.shadowSkip
+    };
   } catch (e) {
     Logger.log(`Error checking blacklist: ${e.toString()}`);
     return { fullBlacklist: false, hunterSkip: false, shadowSkip: false };
@@ -740,6 +2341,7 @@ function checkBlacklist(playerName) {
 }
 
 function addToBlacklist(playerName, chemStyle, currentPriceHunter, currentPriceShadow) {
+  const cacheStatsStart = getSheetCacheStats();
   try {
     const ss = getSpreadsheet();
     const blacklistSheet = ss.getSheetByName(SHEETS.CHEM_BLACKLIST);
@@ -748,25 +2350,22 @@ function addToBlacklist(playerName, chemStyle, currentPriceHunter, currentPriceS
       return { success: false, message: 'Chem Style Blacklist sheet not found' };
     }
     
-    const existingData = getSheetData(SHEETS.CHEM_BLACKLIST, 1);
+    const blacklistIndex = loadBlacklistIndex();
+    const entry = blacklistIndex.get(playerName);
     
-    for (let i = 0; i < existingData.length; i++) {
-      const row = existingData[i];
-      const blPlayerName = (row[1] || '').toString().trim();
-      
-      if (blPlayerName === playerName) {
-        const rowNum = i + 2;
-        
-        if (chemStyle === 'Full') {
-          blacklistSheet.getRange(rowNum, 11).setValue('Y');
-          return { success: true, message: `${playerName} fully blacklisted` };
-        } else if (chemStyle === 'Hunter') {
-          blacklistSheet.getRange(rowNum, 12).setValue('Y');
-          return { success: true, message: `${playerName} Hunter skip enabled` };
-        } else if (chemStyle === 'Shadow') {
-          blacklistSheet.getRange(rowNum, 13).setValue('Y');
-          return { success: true, message: `${playerName} Shadow skip enabled` };
-        }
+    if (entry) {
+      if (chemStyle === 'Full') {
+        writeSheetValues(blacklistSheet, entry.rowNum, 11, [['Y']]);
+        entry.fullBlacklist = true;
+        return { success: true, message: `${playerName} fully blacklisted` };
+      } else if (chemStyle === 'Hunter') {
+        writeSheetValues(blacklistSheet, entry.rowNum, 12, [['Y']]);
+        entry.hunterSkip = true;
+        return { success: true, message: `${playerName} Hunter skip enabled` };
+      } else if (chemStyle === 'Shadow') {
+        writeSheetValues(blacklistSheet, entry.rowNum, 13, [['Y']]);
+        entry.shadowSkip = true;
+        return { success: true, message: `${playerName} Shadow skip enabled` };
       }
     }
     
@@ -794,16 +2393,28 @@ function addToBlacklist(playerName, chemStyle, currentPriceHunter, currentPriceS
     ];
     
     const lastRow = blacklistSheet.getLastRow();
-    blacklistSheet.getRange(lastRow + 1, 1, 1, newRow.length).setValues([newRow]);
+    writeSheetValues(blacklistSheet, lastRow + 1, 1, [newRow]);
+    
+    if (!entry) {
+      blacklistIndex.set(playerName, {
+        rowNum: lastRow + 1,
+        fullBlacklist: fullBL === 'Y',
+        hunterSkip: hunterSkip === 'Y',
+        shadowSkip: shadowSkip === 'Y'
+      });
+    }
     
     return { success: true, message: `${playerName} added to blacklist (${chemStyle})` };
   } catch (e) {
     Logger.log(`Error adding to blacklist: ${e.toString()}`);
     return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('addToBlacklist', cacheStatsStart);
   }
 }
 
 function buildChemStylesDashboard() {
+  const cacheStatsStart = getSheetCacheStats();
   try {
     const ss = getSpreadsheet();
     const chemDashboard = ss.getSheetByName(SHEETS.CHEM_DASHBOARD);
@@ -812,20 +2423,29 @@ function buildChemStylesDashboard() {
       return { success: false, message: 'Chem Style Analysis sheet not found' };
     }
     
-    const hunterData = getSheetData(SHEETS.CHEM_MANUAL_HUNTER, 1);
-    const shadowData = getSheetData(SHEETS.CHEM_MANUAL_SHADOW, 1);
+    // The blacklist read primes loadBlacklistIndex from the same batch call
+    const [hunterData, shadowData, blacklistData, existingChemDashboard] = getSheetDataBatch([
+      SHEETS.CHEM_MANUAL_HUNTER,
+      SHEETS.CHEM_MANUAL_SHADOW,
+      SHEETS.CHEM_BLACKLIST,
+      SHEETS.CHEM_DASHBOARD
+    ]);
     
     if (hunterData.length === 0 && shadowData.length === 0) {
       return { success: false, message: 'No data in Chem Style Manual Entry sheets' };
     }
     
-    const dashLastRow = Math.min(chemDashboard.getLastRow(), MAX_ROWS[SHEETS.CHEM_DASHBOARD] + 1);
-    const dashLastCol = Math.min(chemDashboard.getLastColumn(), MAX_COLS[SHEETS.CHEM_DASHBOARD]);
-    if (dashLastRow > 1 && dashLastCol > 0) {
-      chemDashboard.getRange(2, 1, dashLastRow - 1, dashLastCol).clearContent();
+    const fingerprint = computeFingerprint([hunterData, shadowData, blacklistData]);
+    if (isUnchangedBuild(CHEM_FINGERPRINT_PROPERTY, fingerprint, existingChemDashboard)) {
+      return {
+        success: true,
+        message: `Chem Styles Dashboard already up to date with ${existingChemDashboard.length} players (inputs unchanged, rewrite skipped)`
+      };
     }
     
-    chemDashboard.getRange(1, 1, 1, CHEM_COLUMN_HEADERS.length).setValues([CHEM_COLUMN_HEADERS]);
+    const chemWriter = createSheetWriteBatch(chemDashboard);
+    chemWriter.clear(2, 1, existingChemDashboard.length, MAX_COLS[SHEETS.CHEM_DASHBOARD]);
+    chemWriter.setValues(1, 1, [CHEM_COLUMN_HEADERS]);
     
     const playerMap = {};
     
@@ -957,15 +2577,19 @@ function buildChemStylesDashboard() {
     }
     
     if (dashboardRows.length === 0) {
+      chemWriter.flush();
       return { success: false, message: 'No valid chem styles dashboard rows generated' };
     }
     
-    chemDashboard.getRange(2, 1, dashboardRows.length, dashboardRows[0].length).setValues(dashboardRows);
+    chemWriter.setValues(2, 1, dashboardRows);
     
     const priceColumns = [4, 5, 6, 7, 8, 9];
     for (let col of priceColumns) {
-      chemDashboard.getRange(2, col, dashboardRows.length, 1).setNumberFormat('#,##0');
+      chemWriter.setNumberFormat(2, col, dashboardRows.length, 1, '#,##0');
     }
+    chemWriter.flush();
+    saveBuildFingerprint(CHEM_FINGERPRINT_PROPERTY, fingerprint, dashboardRows.length);
+    clearSnapshot(CHEM_SNAPSHOT_KEY);
     
     return { 
       success: true, 
@@ -975,10 +2599,13 @@ function buildChemStylesDashboard() {
   } catch (e) {
     Logger.log(`Error in buildChemStylesDashboard: ${e.toString()}`);
     return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('buildChemStylesDashboard', cacheStatsStart);
   }
 }
 
 function logChemStylesData() {
+  const cacheStatsStart = getSheetCacheStats();
   try {
     const ss = getSpreadsheet();
     const hunterSheet = ss.getSheetByName(SHEETS.CHEM_MANUAL_HUNTER);
@@ -1003,7 +2630,12 @@ function logChemStylesData() {
       const playerName = (row[0] || '').toString().trim();
       if (!playerName) continue;
       
-      const archiveRow = [ukTimestamp, playerName, 'Hunter', ...row.slice(1)];
+      const archiveRow = normalizeArchiveRow(
+        [ukTimestamp, playerName, 'Hunter', ...row.slice(1)],
+        CHEM_ARCHIVE_PRICE_COLUMNS,
+        CHEM_ARCHIVE_PERCENT_COLUMNS,
+        KEEP_RAW_ARCHIVE_TEXT ? MAX_COLS[SHEETS.CHEM_ARCHIVE] : 0
+      );
       archiveRows.push(archiveRow);
     }
     
@@ -1012,7 +2644,12 @@ function logChemStylesData() {
       const playerName = (row[0] || '').toString().trim();
       if (!playerName) continue;
       
-      const archiveRow = [ukTimestamp, playerName, 'Shadow', ...row.slice(1)];
+      const archiveRow = normalizeArchiveRow(
+        [ukTimestamp, playerName, 'Shadow', ...row.slice(1)],
+        CHEM_ARCHIVE_PRICE_COLUMNS,
+        CHEM_ARCHIVE_PERCENT_COLUMNS,
+        KEEP_RAW_ARCHIVE_TEXT ? MAX_COLS[SHEETS.CHEM_ARCHIVE] : 0
+      );
       archiveRows.push(archiveRow);
     }
     
@@ -1020,16 +2657,28 @@ function logChemStylesData() {
       return { success: false, message: 'No valid data rows to archive' };
     }
     
-    const existingArchiveData = getSheetData(SHEETS.CHEM_ARCHIVE, 1);
-    const startRow = existingArchiveData.length + 2;
+    let startRow = Math.max(archiveSheet.getLastRow(), 1) + 1;
+    const maxArchiveRows = MAX_ROWS[SHEETS.CHEM_ARCHIVE] || 10000;
+    if (startRow - 2 + archiveRows.length > maxArchiveRows) {
+      rotateArchive(SHEETS.CHEM_ARCHIVE, toEpochDay(now) - ANALYSIS_HORIZON_DAYS);
+      // No build reads this archive back, so recent days can go to cold sheets too
+      rotateOldestArchiveDays(SHEETS.CHEM_ARCHIVE, archiveRows.length);
+      startRow = Math.max(archiveSheet.getLastRow(), 1) + 1;
+    }
+    if (startRow - 2 + archiveRows.length > maxArchiveRows) {
+      return { 
+        success: false, 
+        message: `Chem archive is approaching maximum size (${maxArchiveRows} rows). Please clean up old data.` 
+      };
+    }
     
-    archiveSheet.getRange(startRow, 1, archiveRows.length, archiveRows[0].length).setValues(archiveRows);
+    writeSheetValues(archiveSheet, startRow, 1, archiveRows);
     
     if (hunterSheet) {
       const hunterLastRow = Math.min(hunterSheet.getLastRow(), MAX_ROWS[SHEETS.CHEM_MANUAL_HUNTER] + 1);
       if (hunterLastRow > 1) {
         const hunterLastCol = Math.min(hunterSheet.getLastColumn(), MAX_COLS[SHEETS.CHEM_MANUAL_HUNTER]);
-        hunterSheet.getRange(2, 1, hunterLastRow - 1, hunterLastCol).clearContent();
+        clearSheetRange(hunterSheet, 2, 1, hunterLastRow - 1, hunterLastCol);
       }
     }
     
@@ -1037,7 +2686,7 @@ function logChemStylesData() {
       const shadowLastRow = Math.min(shadowSheet.getLastRow(), MAX_ROWS[SHEETS.CHEM_MANUAL_SHADOW] + 1);
       if (shadowLastRow > 1) {
         const shadowLastCol = Math.min(shadowSheet.getLastColumn(), MAX_COLS[SHEETS.CHEM_MANUAL_SHADOW]);
-        shadowSheet.getRange(2, 1, shadowLastRow - 1, shadowLastCol).clearContent();
+        clearSheetRange(shadowSheet, 2, 1, shadowLastRow - 1, shadowLastCol);
       }
     }
     
@@ -1048,26 +2697,552 @@ function logChemStylesData() {
   } catch (e) {
     Logger.log(`Error in logChemStylesData: ${e.toString()}`);
     return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('logChemStylesData', cacheStatsStart);
   }
 }
 
-function getChemStylesDashboardData() {
+function readChemPayload() {
+  const chemData = getSheetData(SHEETS.CHEM_DASHBOARD, 1);
+  const headers = CHEM_COLUMN_HEADERS;
+  return {
+    chemData: chemData,
+    headers: headers
+  };
+}
+
+function getChemStylesDashboardData(knownVersion) {
+  const cacheStatsStart = getSheetCacheStats();
   try {
-    const chemData = getSheetData(SHEETS.CHEM_DASHBOARD, 1);
-    const headers = CHEM_COLUMN_HEADERS;
-    return {
-      chemData: chemData,
-      headers: headers
-    };
+    return serveSnapshot(CHEM_SNAPSHOT_KEY, readChemPayload, knownVersion);
   } catch (e) {
     Logger.log(`Error in getChemStylesDashboardData: ${e.toString()}`);
     return {
       error: `Failed to load chem styles data: ${e.message}`,
       details: e.toString()
     };
+  } finally {
+    logSheetCacheStats('getChemStylesDashboardData', cacheStatsStart);
+  }
+}
+
+// ========================================
+// ARCHIVE MAINTENANCE
+// ========================================
+
+function coldArchiveSheetName(sheetName, epochDay) {
+  const dayKey = formatEpochDay(epochDay);
+  return `${sheetName} ${dayKey.slice(6)}-${dayKey.slice(3, 5)}`;
+}
+
+// Appends rows to "<archive> yyyy-MM" cold sheets, one write per month run
+function appendToColdArchives(sheetName, headerRow, rows, fallbackDay) {
+  const ss = getSpreadsheet();
+  let runStart = 0;
+  let runSheetName = null;
+  let lastDay = fallbackDay;
+  
+  const flushRun = (end) => {
+    if (runSheetName === null || end <= runStart) return;
+    let coldSheet = ss.getSheetByName(runSheetName);
+    if (!coldSheet) {
+      coldSheet = ss.insertSheet(runSheetName);
+      writeSheetValues(coldSheet, 1, 1, [headerRow]);
+    }
+    writeSheetValues(coldSheet, Math.max(coldSheet.getLastRow(), 1) + 1, 1, rows.slice(runStart, end));
+  };
+  
+  for (let i = 0; i < rows.length; i++) {
+    const epochDay = toEpochDay(rows[i][0]);
+    // Undated rows travel with the row before them
+    if (epochDay !== null) lastDay = epochDay;
+    const name = coldArchiveSheetName(sheetName, lastDay);
+    if (name !== runSheetName) {
+      flushRun(i);
+      runStart = i;
+      runSheetName = name;
+    }
+  }
+  flushRun(rows.length);
+}
+
+// Moves up to ARCHIVE_BLOCK_ROWS of the oldest rows dated before cutoffDay to cold
+// sheets and deletes them. Rows inside the horizon are never moved, and an undated
+// row stops the block so it (and everything after it) stays put. Returns the
+// number moved.
+function rotateArchiveBlock(sheetName, cutoffDay) {
+  const sheet = getSpreadsheet().getSheetByName(sheetName);
+  if (!sheet) return 0;
+  const lastRow = sheet.getLastRow();
+  if (lastRow <= 1) return 0;
+  
+  const timestamps = sheet.getRange(2, 1, lastRow - 1, 1).getValues();
+  let moveCount = Math.min(findFirstRowOnOrAfter(timestamps, cutoffDay), ARCHIVE_BLOCK_ROWS);
+  for (let i = 0; i < moveCount; i++) {
+    if (toEpochDay(timestamps[i][0]) === null) {
+      Logger.log(`WARNING: ${sheetName} row ${i + 2} has no readable date; leaving it and later rows in place`);
+      moveCount = i;
+      break;
+    }
+  }
+  if (moveCount <= 0) return 0;
+  
+  const width = sheet.getLastColumn();
+  const headerRow = sheet.getRange(1, 1, 1, width).getValues()[0];
+  const rows = sheet.getRange(2, 1, moveCount, width).getValues();
+  appendToColdArchives(sheetName, headerRow, rows, cutoffDay - 1);
+  sheet.deleteRows(2, moveCount);
+  invalidateSheetData(sheetName);
+  if (sheetName === SHEETS.ARCHIVE) invalidateHistoryStats();
+  Logger.log(`Rotated ${moveCount} rows from ${sheetName} to cold storage`);
+  return moveCount;
+}
+
+// Moves whole days, oldest first and regardless of the horizon, until rowsNeeded
+// more rows fit under the sheet's MAX_ROWS. Returns the last day moved, or null.
+function rotateOldestArchiveDays(sheetName, rowsNeeded) {
+  const sheet = getSpreadsheet().getSheetByName(sheetName);
+  if (!sheet) return null;
+  const maxRows = MAX_ROWS[sheetName];
+  let lastMovedDay = null;
+  while (sheet.getLastRow() > 1 && sheet.getLastRow() - 1 + rowsNeeded > maxRows) {
+    const firstDay = toEpochDay(sheet.getRange(2, 1, 1, 1).getValues()[0][0]);
+    if (firstDay === null || rotateArchiveBlock(sheetName, firstDay + 1) === 0) break;
+    lastMovedDay = firstDay;
+  }
+  return lastMovedDay;
+}
+
+function rotateArchive(sheetName, cutoffDay) {
+  let total = 0;
+  let moved;
+  while ((moved = rotateArchiveBlock(sheetName, cutoffDay)) > 0) {
+    total += moved;
+  }
+  return total;
+}
+
+// Rollup rows are aggregates of archived data, so expired days are simply dropped
+function pruneDailyRollup(cutoffDay) {
+  const sheet = getSpreadsheet().getSheetByName(SHEETS.ROLLUP);
+  if (!sheet) return 0;
+  const lastRow = sheet.getLastRow();
+  if (lastRow <= 1) return 0;
+  
+  const timestamps = sheet.getRange(2, 1, lastRow - 1, 1).getValues();
+  const pruneCount = findFirstRowOnOrAfter(timestamps, cutoffDay);
+  if (pruneCount > 0) {
+    sheet.deleteRows(2, pruneCount);
+    invalidateSheetData(SHEETS.ROLLUP);
+    invalidateHistoryStats();
+  }
+  return pruneCount;
+}
+
+function maintainArchives() {
+  try {
+    return startJob('archiveMaintenance');
+  } catch (e) {
+    Logger.log(`Error in maintainArchives: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  }
+}
+
+function installArchiveMaintenanceTrigger() {
+  ScriptApp.getProjectTriggers()
+    .filter(trigger => trigger.getHandlerFunction() === 'maintainArchives')
+    .forEach(trigger => ScriptApp.deleteTrigger(trigger));
+  ScriptApp.newTrigger('maintainArchives').timeBased().everyDays(1).atHour(4).create();
+  return { success: true, message: 'Daily archive maintenance scheduled for 04:00' };
+}
+
+function migrateArchiveSheetToNumeric(sheetName, priceColumns, percentColumns) {
+  const sheet = getSpreadsheet().getSheetByName(sheetName);
+  if (!sheet) return 0;
+  const lastRow = sheet.getLastRow();
+  const width = MAX_COLS[sheetName];
+  if (lastRow <= 1) return 0;
+  
+  const BLOCK_ROWS = 5000;
+  let changedRows = 0;
+  for (let start = 2; start <= lastRow; start += BLOCK_ROWS) {
+    const numRows = Math.min(BLOCK_ROWS, lastRow - start + 1);
+    const values = sheet.getRange(start, 1, numRows, width).getValues();
+    let blockChanged = false;
+    const normalizedRows = values.map(row => {
+      const normalized = normalizeArchiveRow(row, priceColumns, percentColumns, KEEP_RAW_ARCHIVE_TEXT ? width : 0);
+      for (let col = 0; col < width; col++) {
+        if (normalized[col] !== row[col]) {
+          blockChanged = true;
+          changedRows++;
+          break;
+        }
+      }
+      return normalized;
+    });
+    if (blockChanged) {
+      writeSheetValues(sheet, start, 1, normalizedRows);
+    }
+  }
+  return changedRows;
+}
+
+function migrateArchivesToNumeric() {
+  try {
+    const archiveRows = migrateArchiveSheetToNumeric(SHEETS.ARCHIVE, ARCHIVE_PRICE_COLUMNS, ARCHIVE_PERCENT_COLUMNS);
+    const chemRows = migrateArchiveSheetToNumeric(SHEETS.CHEM_ARCHIVE, CHEM_ARCHIVE_PRICE_COLUMNS, CHEM_ARCHIVE_PERCENT_COLUMNS);
+    return { 
+      success: true, 
+      message: `Normalized ${archiveRows} Historic Archive rows and ${chemRows} Chem Style archive rows to numbers` 
+    };
+  } catch (e) {
+    Logger.log(`Error in migrateArchivesToNumeric: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  }
+}
+
+// ========================================
+// RESUMABLE JOBS
+// ========================================
+
+// Long work runs as a job: a list of small steps with the job state checkpointed to
+// script properties after each one. When an execution nears the budget the job
+// schedules a continueJobs trigger and stops; the final swap into the output
+// sheets only happens in finish(), so a killed run never leaves a partial sheet.
+const JOB_TIME_BUDGET_MS = 4 * 60 * 1000;
+const JOB_CONTINUE_AFTER_MS = 60 * 1000;
+const JOB_CHUNK_PLAYERS = 50;
+const JOB_STATE_PREFIX = 'JOB_STATE_';
+
+// Each job: start(args) -> state, step(state) -> true once every step is done,
+// finish(state) -> { success, message }. State must survive JSON.
+const JOBS = {
+  dashboardBuild: {
+    label: 'Dashboard build',
+    start(args) {
+      return { mode: args.mode, fingerprint: null, today: null, chunks: [], processed: 0, total: 0 };
+    },
+    // Prices a chunk of players in every mode and parks the rows in the cache under
+    // the inputs' fingerprint. An edit, a log or a new day changes the fingerprint
+    // and starts the chunks over.
+    step(state) {
+      const today = toEpochDay(new Date());
+      const manualData = getSheetData(SHEETS.MANUAL);
+      const fingerprint = dashboardBuildFingerprint(manualData, state.mode, today);
+      if (fingerprint !== state.fingerprint) {
+        state.fingerprint = fingerprint;
+        state.today = today;
+        state.chunks = [];
+        state.processed = 0;
+        state.upToDate = isUnchangedBuild(DASHBOARD_FINGERPRINT_PROPERTY, fingerprint, getSheetData(SHEETS.DASHBOARD));
+      }
+      state.total = manualData.length;
+      if (state.upToDate || state.processed >= state.total) return true;
+      
+      const start = state.processed;
+      const statsList = computeStatsForRows(manualData.slice(start, start + JOB_CHUNK_PLAYERS), start, today);
+      putChunkedCache(dashboardJobRowsKey(fingerprint, start), JSON.stringify(priceDashboardRows(statsList, state.mode)));
+      state.chunks.push(start);
+      state.processed = Math.min(start + JOB_CHUNK_PLAYERS, state.total);
+      return state.processed >= state.total;
+    },
+    // Merges the cached chunks in Manual Data Entry order into one diff write
+    finish(state) {
+      const modeText = state.mode.charAt(0).toUpperCase() + state.mode.slice(1);
+      if (state.total === 0) {
+        return { success: false, message: 'No data in Manual Data Entry sheet' };
+      }
+      if (state.upToDate) {
+        clearDirtyPlayersIfUnchanged(state.mode, state.fingerprint);
+        return {
+          success: true,
+          message: `Dashboard already up to date in ${modeText} Mode with ${getSheetData(SHEETS.DASHBOARD).length} players (inputs unchanged, rewrite skipped)`
+        };
+      }
+      
+      invalidateSheetData(SHEETS.MANUAL);
+      if (dashboardBuildFingerprint(getSheetData(SHEETS.MANUAL), state.mode, state.today) !== state.fingerprint) {
+        return { success: false, message: 'Manual Data Entry or the archive changed during the rebuild; please rebuild again' };
+      }
+      const dashboardRows = [];
+      const modeRows = [];
+      for (let i = 0; i < state.chunks.length; i++) {
+        const key = dashboardJobRowsKey(state.fingerprint, state.chunks[i]);
+        const text = getChunkedCache(key);
+        if (!text) {
+          return { success: false, message: 'Dashboard build rows expired from the cache; please rebuild again' };
+        }
+        const chunk = JSON.parse(text);
+        dashboardRows.push(...chunk.dashboardRows);
+        modeRows.push(...chunk.modeRows);
+        removeChunkedCache(key);
+      }
+      const result = commitDashboardShards(state.mode, state.fingerprint, dashboardRows, modeRows);
+      if (result.success && isSnapshotScheduleOn()) {
+        saveSnapshot(DASHBOARD_SNAPSHOT_KEY, readVersionedPayload(readDashboardPayload));
+      }
+      return result;
+    }
+  },
+  
+  archiveMaintenance: {
+    label: 'Archive maintenance',
+    start() {
+      return {
+        cutoffDay: toEpochDay(new Date()) - ANALYSIS_HORIZON_DAYS,
+        pending: [SHEETS.ARCHIVE, SHEETS.CHEM_ARCHIVE],
+        moved: {},
+        processed: 0,
+        total: 3
+      };
+    },
+    // One block of one archive per step; rows are copied out then deleted, so a
+    // stop between steps loses nothing
+    step(state) {
+      if (state.pending.length > 0) {
+        const sheetName = state.pending[0];
+        const moved = rotateArchiveBlock(sheetName, state.cutoffDay);
+        state.moved[sheetName] = (state.moved[sheetName] || 0) + moved;
+        if (moved === 0) {
+          state.pending.shift();
+          state.processed++;
+        }
+        return false;
+      }
+      state.pruned = pruneDailyRollup(state.cutoffDay);
+      state.processed++;
+      return true;
+    },
+    finish(state) {
+      const archiveMoved = state.moved[SHEETS.ARCHIVE] || 0;
+      const chemMoved = state.moved[SHEETS.CHEM_ARCHIVE] || 0;
+      return { 
+        success: true, 
+        message: `Moved ${archiveMoved} Historic Archive rows and ${chemMoved} Chem Style archive rows to cold storage, pruned ${state.pruned} rollup rows` 
+      };
+    }
+  }
+};
+
+function dashboardJobRowsKey(fingerprint, start) {
+  return `${JOB_STATE_PREFIX}dashboardBuild_${fingerprint}_${start}`;
+}
+
+function jobStateKey(name) {
+  return `${JOB_STATE_PREFIX}${name}`;
+}
+
+// Replaces any unfinished run of the same job, unless another execution is still
+// working on it
+function startJob(name, args) {
+  const job = JOBS[name];
+  if (!job) return { success: false, message: `Unknown job: ${name}` };
+  const state = job.start(args || {});
+  state.done = false;
+  return runJob(name, Date.now() + JOB_TIME_BUDGET_MS, state);
+}
+
+// Takes the job for this execution until deadline, starting it over from freshState
+// when given. Returns { state } or, while another execution holds it, { busy }.
+function claimJob(name, deadline, freshState) {
+  const key = jobStateKey(name);
+  const lock = LockService.getScriptLock();
+  lock.waitLock(10000);
+  try {
+    const stored = getChunkedProperty(key);
+    const current = stored ? JSON.parse(stored) : null;
+    if (current && current.runningUntil && current.runningUntil > Date.now()) {
+      return { busy: current };
+    }
+    const state = freshState || current;
+    if (!state) return {};
+    state.runningUntil = deadline;
+    putChunkedProperty(key, JSON.stringify(state));
+    return { state: state };
+  } finally {
+    lock.releaseLock();
+  }
+}
+
+function runJob(name, deadline, freshState) {
+  const job = JOBS[name];
+  const key = jobStateKey(name);
+  const claim = claimJob(name, deadline, freshState);
+  if (claim.busy) {
+    return { success: true, pending: true, message: `${job.label} is already running (${claim.busy.processed}/${claim.busy.total} done)` };
+  }
+  const state = claim.state;
+  if (!state) return { success: false, message: `No unfinished ${job.label.toLowerCase()} to run` };
+  
+  try {
+    // The deadline is checked before finish() too, so the final swap starts with
+    // the rest of the execution's time still in hand
+    while (Date.now() < deadline) {
+      if (state.done) {
+        // Hold the claim through finish() so a second start cannot write alongside it
+        state.runningUntil = Date.now() + JOB_TIME_BUDGET_MS;
+        putChunkedProperty(key, JSON.stringify(state));
+        try {
+          return job.finish(state);
+        } finally {
+          deleteChunkedProperty(key);
+        }
+      }
+      state.done = job.step(state);
+      putChunkedProperty(key, JSON.stringify(state));
+    }
+  } catch (e) {
+    deleteChunkedProperty(key);
+    Logger.log(`Error in job ${name}: ${e.toString()}`);
+    return { success: false, message: `${job.label} failed at ${state.processed}/${state.total}: ${e.message}` };
+  }
+  
+  state.runningUntil = 0;
+  putChunkedProperty(key, JSON.stringify(state));
+  scheduleJobContinuation();
+  return { 
+    success: true, 
+    pending: true, 
+    message: `${job.label} paused at ${state.processed}/${state.total}; it will continue in the background` 
+  };
+}
+
+function scheduleJobContinuation() {
+  const scheduled = ScriptApp.getProjectTriggers()
+    .some(trigger => trigger.getHandlerFunction() === 'continueJobs');
+  if (!scheduled) {
+    ScriptApp.newTrigger('continueJobs').timeBased().after(JOB_CONTINUE_AFTER_MS).create();
+  }
+}
+
+// One-off trigger handler: picks up every unfinished job within one shared budget
+function continueJobs() {
+  ScriptApp.getProjectTriggers()
+    .filter(trigger => trigger.getHandlerFunction() === 'continueJobs')
+    .forEach(trigger => ScriptApp.deleteTrigger(trigger));
+  
+  const deadline = Date.now() + JOB_TIME_BUDGET_MS;
+  Object.keys(JOBS).forEach(name => {
+    if (!PropertiesService.getScriptProperties().getProperty(jobStateKey(name))) return;
+    try {
+      const result = runJob(name, deadline);
+      Logger.log(`continueJobs ${name}: ${result.message}`);
+    } catch (e) {
+      Logger.log(`Error continuing job ${name}: ${e.toString()}`);
+    }
+  });
+}
+
+// ========================================
+// BACKGROUND SNAPSHOTS
+// ========================================
+
+// With the refresh trigger installed, the web app is served from snapshots that a
+// time-driven trigger rebuilds every SNAPSHOT_REFRESH_MINUTES; without it every
+// load reads the sheets as before. Writes made through this script drop the
+// affected snapshot so the next load sees them.
+const SNAPSHOT_REFRESH_MINUTES = 15;
+const SNAPSHOT_SCHEDULE_PROPERTY = 'SNAPSHOT_SCHEDULE';
+const DASHBOARD_SNAPSHOT_KEY = 'DASHBOARD_SNAPSHOT';
+const CHEM_SNAPSHOT_KEY = 'CHEM_SNAPSHOT';
+
+function isSnapshotScheduleOn() {
+  return PropertiesService.getScriptProperties().getProperty(SNAPSHOT_SCHEDULE_PROPERTY) === 'on';
+}
+
+function saveSnapshot(key, payload) {
+  putChunkedCache(key, JSON.stringify({ builtAt: Date.now(), payload: payload }));
+}
+
+function clearSnapshot(key) {
+  removeChunkedCache(key);
+}
+
+// Payloads carry a version stamp, a hash of their contents, which the web UI keeps
+// with its local copy and sends back to ask only for something newer
+function readVersionedPayload(readPayload) {
+  const payload = readPayload();
+  payload.version = computeFingerprint(payload);
+  return payload;
+}
+
+// Returns the stored payload with its age in seconds, or reads it fresh (and
+// stores it when the schedule is on) on a miss. A caller already holding
+// knownVersion gets { unchanged: true } in place of the payload.
+function serveSnapshot(key, readPayload, knownVersion) {
+  let payload = null;
+  let ageSeconds = 0;
+  if (isSnapshotScheduleOn()) {
+    const text = getChunkedCache(key);
+    if (text) {
+      const snapshot = JSON.parse(text);
+      payload = snapshot.payload;
+      ageSeconds = Math.max(0, Math.round((Date.now() - snapshot.builtAt) / 1000));
+      // Snapshots stored before payloads were versioned get their stamp once
+      if (!payload.version) {
+        payload.version = computeFingerprint(payload);
+        putChunkedCache(key, JSON.stringify(snapshot));
+      }
+    }
+  }
+  if (!payload) {
+    payload = readVersionedPayload(readPayload);
+    if (isSnapshotScheduleOn()) saveSnapshot(key, payload);
+  }
+  if (knownVersion && payload.version === knownVersion) {
+    return { unchanged: true, version: knownVersion, snapshotAgeSeconds: ageSeconds };
+  }
+  payload.snapshotAgeSeconds = ageSeconds;
+  return payload;
+}
+
+// Time-driven handler: rebuilds the dashboard (every mode, in the last used mode)
+// and the chem dashboard, then stores fresh snapshots of both
+function refreshSnapshots() {
+  const cacheStatsStart = getSheetCacheStats();
+  try {
+    const mode = PropertiesService.getScriptProperties().getProperty(DASHBOARD_MODE_PROPERTY) || 'normal';
+    const dashboardResult = runDashboardBuild(mode);
+    const chemResult = buildChemStylesDashboard();
+    
+    // A paused build has not rewritten the dashboard yet; its finish() stores the
+    // snapshot once it has
+    if (!dashboardResult.pending) {
+      saveSnapshot(DASHBOARD_SNAPSHOT_KEY, readVersionedPayload(readDashboardPayload));
+    }
+    saveSnapshot(CHEM_SNAPSHOT_KEY, readVersionedPayload(readChemPayload));
+    
+    return {
+      success: dashboardResult.success && chemResult.success,
+      message: `${dashboardResult.message}. ${chemResult.message}. ${dashboardResult.pending ? 'Chem snapshot refreshed.' : 'Snapshots refreshed.'}`
+    };
+  } catch (e) {
+    Logger.log(`Error in refreshSnapshots: ${e.toString()}`);
+    return { success: false, message: `Error: ${e.message}` };
+  } finally {
+    logSheetCacheStats('refreshSnapshots', cacheStatsStart);
   }
 }
 
+function installSnapshotTrigger() {
+  ScriptApp.getProjectTriggers()
+    .filter(trigger => trigger.getHandlerFunction() === 'refreshSnapshots')
+    .forEach(trigger => ScriptApp.deleteTrigger(trigger));
+  ScriptApp.newTrigger('refreshSnapshots').timeBased().everyMinutes(SNAPSHOT_REFRESH_MINUTES).create();
+  PropertiesService.getScriptProperties().setProperty(SNAPSHOT_SCHEDULE_PROPERTY, 'on');
+  return { success: true, message: `Dashboards will be rebuilt in the background every ${SNAPSHOT_REFRESH_MINUTES} minutes` };
+}
+
+function removeSnapshotTrigger() {
+  ScriptApp.getProjectTriggers()
+    .filter(trigger => trigger.getHandlerFunction() === 'refreshSnapshots')
+    .forEach(trigger => ScriptApp.deleteTrigger(trigger));
+  PropertiesService.getScriptProperties().deleteProperty(SNAPSHOT_SCHEDULE_PROPERTY);
+  clearSnapshot(DASHBOARD_SNAPSHOT_KEY);
+  clearSnapshot(CHEM_SNAPSHOT_KEY);
+  return { success: true, message: 'Background dashboard refresh stopped' };
+}
+
 // ========================================
 // WEB APP ENTRY POINT
 // ========================================
@@ -1166,10 +3341,18 @@ function getHtmlOutput() {
         td {
             padding: 10px 12px;
             border-bottom: 1px solid #e9ecef;
+            white-space: nowrap;
         }
         tr:hover {
             background-color: #f8f9fa;
         }
+        tr.virtual-spacer td {
+            padding: 0;
+            border: 0;
+        }
+        tr.virtual-spacer:hover {
+            background-color: transparent;
+        }
         .loading {
             display: inline-block;
             width: 20px;
@@ -1266,10 +3449,11 @@ function getHtmlOutput() {
                     <button onclick="buildDashboard('crash')" class="btn btn-primary">🚨 Build Crash Mode</button>
                     <button onclick="buildDashboard('rise')" class="btn btn-primary">📈 Build Rise Mode</button>
                     <button onclick="buildDashboard('investments')" class="btn btn-primary">💼 Build Investments Mode</button>
+                    <button onclick="rebuildDashboard()" class="btn btn-primary">🔁 Rebuild</button>
                     <button onclick="logData()" class="btn btn-primary">📝 Log Manual Data</button>
                     <button onclick="loadDashboard()" class="btn btn-primary">🔄 Refresh</button>
                 </div>
-                <input type="text" id="searchBox" class="search-box" placeholder="Search players..." onkeyup="filterTable()">
+                <input type="text" id="searchBox" class="search-box" placeholder="Search players... (e.g. profit>4 version:TOTW)" oninput="filterTable()">
             </div>
 
             <div class="card p-6 mb-6">
@@ -1285,7 +3469,7 @@ function getHtmlOutput() {
                     <button onclick="logChemData()" class="btn btn-chem">📝 Log Chem Data</button>
                     <button onclick="loadChemDashboard()" class="btn btn-chem">🔄 Refresh</button>
                 </div>
-                <input type="text" id="chemSearchBox" class="search-box" placeholder="Search players..." onkeyup="filterChemTable()">
+                <input type="text" id="chemSearchBox" class="search-box" placeholder="Search players... (e.g. mpr>20 chem:hunter)" oninput="filterChemTable()">
             </div>
         </div>
 
@@ -1294,7 +3478,7 @@ function getHtmlOutput() {
         </div>
 
         <div class="card p-6">
-            <div class="table-container">
+            <div id="tableContainer" class="table-container">
                 <table id="dashboardTable">
                     <thead>
                         <tr id="tableHeader"></tr>
@@ -1315,10 +3499,22 @@ function getHtmlOutput() {
 
     <script>
         let dashboardData = [];
+        let modeTargets = null;
+        let activeMode = 'normal';
         let headers = [];
         let visibleColumns = [];
         let chemData = [];
         let chemHeaders = [];
+        // Version stamps of the payloads shown, sent back to fetch only newer ones, and
+        // when that data was built (ms)
+        let dashboardVersion = null;
+        let chemVersion = null;
+        let dashboardDataAt = 0;
+        let chemDataAt = 0;
+        // Row indexes in display order, as returned by the table engine: the sorted
+        // order, then narrowed by the search box. The data arrays are never reordered.
+        let dashboardView = [];
+        let chemView = [];
         let currentView = 'fluctuations';
         let contextMenuPlayer = null;
 
@@ -1353,6 +3549,27 @@ function getHtmlOutput() {
             return str;
         }
 
+        // Background-refreshed or locally saved data says how old it is once it is
+        // over a minute old
+        function showSnapshotAge(ageSeconds) {
+            if (!ageSeconds || ageSeconds < 60) return;
+            showStatus(dataAgeText(ageSeconds));
+        }
+
+        function dataAgeText(ageSeconds) {
+            const minutes = Math.round(ageSeconds / 60);
+            if (minutes < 120) return 'Showing data refreshed ' + minutes + ' min ago';
+            const hours = Math.round(minutes / 60);
+            if (hours < 48) return 'Showing data refreshed ' + hours + ' hours ago';
+            return 'Showing data refreshed ' + Math.round(hours / 24) + ' days ago';
+        }
+
+        // When the server cannot be reached the saved copy stays up, so say how old it is
+        function showLoadError(message, dataAt) {
+            const suffix = dataAt ? '. ' + dataAgeText(Math.max(0, (Date.now() - dataAt) / 1000)) : '';
+            showStatus(message + suffix, true);
+        }
+
         function switchTab(tab) {
             currentView = tab;
             if (tab === 'fluctuations') {
@@ -1370,47 +3587,183 @@ function getHtmlOutput() {
             }
         }
 
-        function loadDashboard() {
-            google.script.run
-                .withSuccessHandler(function(data) {
-                    if (data.error) {
-                        showStatus(data.error, true);
+        // Stale-while-revalidate: show what this page or the local cache already holds,
+        // then ask the server for anything newer than that copy's version
+        function loadDashboard() {
+            const cached = dashboardVersion ? Promise.resolve(null) : readCachedPayload('dashboard');
+            cached.then(function(payload) {
+                if (payload) {
+                    applyDashboardPayload(payload);
+                    showSnapshotAge((Date.now() - payload.cachedAt) / 1000);
+                } else if (dashboardVersion) {
+                    updateDashboardView();
+                }
+                google.script.run
+                    .withSuccessHandler(function(data) {
+                        if (data.error) {
+                            showLoadError(data.error, dashboardDataAt);
+                            return;
+                        }
+                        showSnapshotAge(data.snapshotAgeSeconds);
+                        dashboardDataAt = Date.now() - (data.snapshotAgeSeconds || 0) * 1000;
+                        if (data.unchanged) return;
+                        data.cachedAt = dashboardDataAt;
+                        applyDashboardPayload(data);
+                        writeCachedPayload('dashboard', data);
+                    })
+                    .withFailureHandler(function(error) {
+                        showLoadError('Error loading dashboard: ' + error.message, dashboardDataAt);
+                    })
+                    .getDashboardData(dashboardVersion);
+            });
+        }
+
+        function loadChemDashboard() {
+            const cached = chemVersion ? Promise.resolve(null) : readCachedPayload('chem');
+            cached.then(function(payload) {
+                if (payload) {
+                    applyChemPayload(payload);
+                    showSnapshotAge((Date.now() - payload.cachedAt) / 1000);
+                } else if (chemVersion) {
+                    updateChemView();
+                }
+                google.script.run
+                    .withSuccessHandler(function(data) {
+                        if (data.error) {
+                            showLoadError(data.error, chemDataAt);
+                            return;
+                        }
+                        showSnapshotAge(data.snapshotAgeSeconds);
+                        chemDataAt = Date.now() - (data.snapshotAgeSeconds || 0) * 1000;
+                        if (data.unchanged) return;
+                        data.cachedAt = chemDataAt;
+                        applyChemPayload(data);
+                        writeCachedPayload('chem', data);
+                    })
+                    .withFailureHandler(function(error) {
+                        showLoadError('Error loading chem styles: ' + error.message, chemDataAt);
+                    })
+                    .getChemStylesDashboardData(chemVersion);
+            });
+        }
+
+        function applyDashboardPayload(data) {
+            const changed = changedRowIndexes(dashboardData, data.dashboardData, headers, data.headers);
+            const columnsChanged = JSON.stringify(visibleColumns) !== JSON.stringify(data.visibleColumns);
+            dashboardVersion = data.version;
+            dashboardDataAt = data.cachedAt || 0;
+            modeTargets = data.modeTargets;
+            activeMode = data.activeMode;
+            headers = data.headers;
+            visibleColumns = data.visibleColumns;
+            
+            if (data.crashMode) {
+                document.getElementById('crashBanner').classList.remove('hidden');
+            } else {
+                document.getElementById('crashBanner').classList.add('hidden');
+            }
+            
+            if (changed) {
+                changed.forEach(i => { dashboardData[i] = data.dashboardData[i]; });
+                if (changed.length) {
+                    postTableMessage({ type: 'setRows', table: 'dashboard', indexes: changed, rows: changed.map(i => dashboardData[i]) });
+                }
+                if (columnsChanged) {
+                    renderColumnCheckboxes();
+                    postDashboardColumns();
+                }
+            } else {
+                dashboardData = data.dashboardData;
+                renderColumnCheckboxes();
+                postDashboardRows();
+            }
+            updateDashboardView();
+        }
+
+        function applyChemPayload(data) {
+            const changed = changedRowIndexes(chemData, data.chemData, chemHeaders, data.headers);
+            chemVersion = data.version;
+            chemDataAt = data.cachedAt || 0;
+            chemHeaders = data.headers;
+            if (changed) {
+                changed.forEach(i => { chemData[i] = data.chemData[i]; });
+                if (changed.length) {
+                    postTableMessage({ type: 'setRows', table: 'chem', indexes: changed, rows: changed.map(i => chemData[i]) });
+                }
+            } else {
+                chemData = data.chemData;
+                postChemRows();
+            }
+            updateChemView();
+        }
+
+        // Indexes of the rows that differ, or null when the tables do not line up row
+        // for row (first load, rows added or removed, new headers) and are replaced whole
+        function changedRowIndexes(oldRows, newRows, oldHeaders, newHeaders) {
+            if (!oldRows.length || oldRows.length !== newRows.length) return null;
+            if (JSON.stringify(oldHeaders) !== JSON.stringify(newHeaders)) return null;
+            const changed = [];
+            newRows.forEach((row, i) => {
+                if (JSON.stringify(row) !== JSON.stringify(oldRows[i])) changed.push(i);
+            });
+            return changed;
+        }
+
+        // ==================== LOCAL PAYLOAD CACHE ====================
+        // The last payload of each dashboard, with its server version stamp, is kept
+        // in IndexedDB so a newly opened console can draw it before the server answers.
+        // Without IndexedDB (private windows, storage blocked) every load goes to the
+        // server as before.
+        const PAYLOAD_CACHE_DB = 'fut-trading-console';
+        const PAYLOAD_CACHE_STORE = 'payloads';
+        let payloadCache = null;
+
+        function openPayloadCache() {
+            if (!payloadCache) {
+                payloadCache = new Promise(function(resolve) {
+                    if (typeof indexedDB === 'undefined') {
+                        resolve(null);
                         return;
                     }
-                    dashboardData = data.dashboardData;
-                    headers = data.headers;
-                    visibleColumns = data.visibleColumns;
-                    
-                    if (data.crashMode) {
-                        document.getElementById('crashBanner').classList.remove('hidden');
-                    } else {
-                        document.getElementById('crashBanner').classList.add('hidden');
+                    try {
+                        const request = indexedDB.open(PAYLOAD_CACHE_DB, 1);
+                        request.onupgradeneeded = () => request.result.createObjectStore(PAYLOAD_CACHE_STORE);
+                        request.onsuccess = () => resolve(request.result);
+                        request.onerror = () => resolve(null);
+                        request.onblocked = () => resolve(null);
+                    } catch (e) {
+                        resolve(null);
                     }
-                    
-                    renderColumnCheckboxes();
-                    renderTable();
-                })
-                .withFailureHandler(function(error) {
-                    showStatus('Error loading dashboard: ' + error.message, true);
-                })
-                .getDashboardData();
+                });
+            }
+            return payloadCache;
         }
 
-        function loadChemDashboard() {
-            google.script.run
-                .withSuccessHandler(function(data) {
-                    if (data.error) {
-                        showStatus(data.error, true);
-                        return;
-                    }
-                    chemData = data.chemData;
-                    chemHeaders = data.headers;
-                    renderChemTable();
-                })
-                .withFailureHandler(function(error) {
-                    showStatus('Error loading chem styles: ' + error.message, true);
-                })
-                .getChemStylesDashboardData();
+        function readCachedPayload(name) {
+            return openPayloadCache().then(db => new Promise(function(resolve) {
+                if (!db) {
+                    resolve(null);
+                    return;
+                }
+                try {
+                    const request = db.transaction(PAYLOAD_CACHE_STORE, 'readonly').objectStore(PAYLOAD_CACHE_STORE).get(name);
+                    request.onsuccess = () => resolve(request.result || null);
+                    request.onerror = () => resolve(null);
+                } catch (e) {
+                    resolve(null);
+                }
+            }));
+        }
+
+        function writeCachedPayload(name, payload) {
+            openPayloadCache().then(db => {
+                if (!db) return;
+                try {
+                    db.transaction(PAYLOAD_CACHE_STORE, 'readwrite').objectStore(PAYLOAD_CACHE_STORE).put(payload, name);
+                } catch (e) {
+                    // Quota or a closed connection: keep serving from the server
+                }
+            });
         }
 
         function renderColumnCheckboxes() {
@@ -1442,11 +3795,9 @@ function getHtmlOutput() {
                 visibleColumns.push(index);
                 visibleColumns.sort((a, b) => a - b);
             }
-            google.script.run
-                .withSuccessHandler(function(result) {
-                    renderTable();
-                })
-                .savePreferences(visibleColumns);
+            postDashboardColumns();
+            updateDashboardView();
+            google.script.run.savePreferences(visibleColumns);
         }
 
         let sortColumn = -1;
@@ -1454,6 +3805,74 @@ function getHtmlOutput() {
         let chemSortColumn = -1;
         let chemSortDirection = 'asc';
 
+        // Columns after this index (blacklist flags) are not shown in the chem table
+        const CHEM_VISIBLE_COLUMNS = 9;
+        const PERCENTAGE_COLUMNS = [7, 8, 9, 19]; // % From Low Point, % From Hist Low (7D), % From 14D Low, Net Profit %
+
+        // Sort keys for one loaded data array. Each column is parsed once into a
+        // Float64Array (NaN where the cell is not a number, after stripping stripPattern)
+        // and a lower-cased collation array; each sorted order is kept per column and
+        // direction, so sorting a column again, either way round, is a lookup.
+        function createSortKeys(rows, stripPattern) {
+            return { rows: rows, stripPattern: stripPattern, numbers: {}, strings: {}, orders: {} };
+        }
+
+        // Forget the keys and orders of columns whose cells were rewritten in place
+        function dropSortColumns(keys, columnIndexes) {
+            columnIndexes.forEach(colIndex => {
+                delete keys.numbers[colIndex];
+                delete keys.strings[colIndex];
+                delete keys.orders[colIndex + ':asc'];
+                delete keys.orders[colIndex + ':desc'];
+            });
+        }
+
+        function indexSortColumn(keys, colIndex) {
+            if (!keys.numbers[colIndex]) {
+                const numbers = new Float64Array(keys.rows.length);
+                const strings = new Array(keys.rows.length);
+                keys.rows.forEach((row, i) => {
+                    const text = String(row[colIndex]);
+                    numbers[i] = parseFloat(text.replace(keys.stripPattern, ''));
+                    strings[i] = text.toLowerCase();
+                });
+                keys.numbers[colIndex] = numbers;
+                keys.strings[colIndex] = strings;
+            }
+        }
+
+        // Returns a Uint32Array of row indexes; treat it as read-only, it is shared
+        // through the cache
+        function sortedRowOrder(keys, colIndex, direction) {
+            const cacheKey = colIndex + ':' + direction;
+            if (keys.orders[cacheKey]) return keys.orders[cacheKey];
+            
+            const opposite = keys.orders[colIndex + ':' + (direction === 'asc' ? 'desc' : 'asc')];
+            let order;
+            if (colIndex < 0) {
+                order = new Uint32Array(keys.rows.length).map((value, i) => i);
+            } else if (opposite) {
+                order = opposite.slice().reverse();
+            } else {
+                indexSortColumn(keys, colIndex);
+                const numbers = keys.numbers[colIndex];
+                const strings = keys.strings[colIndex];
+                order = new Uint32Array(keys.rows.length).map((value, i) => i);
+                // Numbers compare numerically, anything else case-insensitively
+                order.sort((a, b) => {
+                    const numA = numbers[a];
+                    const numB = numbers[b];
+                    if (numA === numA && numB === numB) return numA - numB;
+                    if (strings[a] < strings[b]) return -1;
+                    if (strings[a] > strings[b]) return 1;
+                    return 0;
+                });
+                if (direction !== 'asc') order.reverse();
+            }
+            keys.orders[cacheKey] = order;
+            return order;
+        }
+
         function sortTable(colIndex) {
             if (sortColumn === colIndex) {
                 sortDirection = sortDirection === 'asc' ? 'desc' : 'asc';
@@ -1461,26 +3880,7 @@ function getHtmlOutput() {
                 sortColumn = colIndex;
                 sortDirection = 'asc';
             }
-            
-            dashboardData.sort((a, b) => {
-                let valA = a[colIndex];
-                let valB = b[colIndex];
-                
-                const numA = parseFloat(String(valA).replace(/[,%🔥]/g, ''));
-                const numB = parseFloat(String(valB).replace(/[,%🔥]/g, ''));
-                
-                if (!isNaN(numA) && !isNaN(numB)) {
-                    return sortDirection === 'asc' ? numA - numB : numB - numA;
-                }
-                
-                valA = String(valA).toLowerCase();
-                valB = String(valB).toLowerCase();
-                if (valA < valB) return sortDirection === 'asc' ? -1 : 1;
-                if (valA > valB) return sortDirection === 'asc' ? 1 : -1;
-                return 0;
-            });
-            
-            renderTable();
+            updateDashboardView();
         }
 
         function sortChemTable(colIndex) {
@@ -1490,100 +3890,447 @@ function getHtmlOutput() {
                 chemSortColumn = colIndex;
                 chemSortDirection = 'asc';
             }
-            
-            chemData.sort((a, b) => {
-                let valA = a[colIndex];
-                let valB = b[colIndex];
-                
-                const numA = parseFloat(String(valA).replace(/[,%]/g, ''));
-                const numB = parseFloat(String(valB).replace(/[,%]/g, ''));
-                
-                if (!isNaN(numA) && !isNaN(numB)) {
-                    return chemSortDirection === 'asc' ? numA - numB : numB - numA;
+            updateChemView();
+        }
+
+        // FIXED: Percentage columns are formatted for display
+        function dashboardCellText(row, colIndex) {
+            let value = row[colIndex];
+            if (PERCENTAGE_COLUMNS.includes(colIndex)) {
+                value = formatPercentage(value);
+            }
+            return value === 0 || value === '' || value === null || value === undefined ? '' : String(value);
+        }
+
+        function chemCellText(row, colIndex) {
+            const value = row[colIndex];
+            if (colIndex === 0) return value === null || value === undefined ? '' : String(value);
+            return value === 0 || value === '' || value === null || value === undefined ? '' : String(value);
+        }
+
+        function updateDashboardView() {
+            requestTableView('dashboard', sortColumn, sortDirection, document.getElementById('searchBox').value);
+        }
+
+        function updateChemView() {
+            requestTableView('chem', chemSortColumn, chemSortDirection, document.getElementById('chemSearchBox').value);
+        }
+
+        // Short names for typed filters; any other field name matches a column header
+        // with spaces and punctuation removed (e.g. high24h, currentprice)
+        const DASHBOARD_SEARCH_FIELDS = {
+            player: 0, name: 0, version: 1, price: 2, current: 2, avg: 3, low7d: 4, prevlow: 5, low: 6,
+            movement: 16, buy: 17, sell: 18, profit: 19, net: 19
+        };
+        const CHEM_SEARCH_FIELDS = {
+            player: 0, name: 0, chem: 1, style: 1, mpr: 2, hunterbuy: 3, huntersell: 4,
+            shadowbuy: 5, shadowsell: 6, hunterprice: 7, shadowprice: 8
+        };
+        const SEARCH_DEBOUNCE_MS = 150;
+
+        // keys[i] is row i's displayed text over the searchable columns, upper-cased and
+        // joined; per-column text and numbers for typed filters are filled on first use
+        function buildSearchIndex(rows, columns, cellText) {
+            return {
+                rows: rows,
+                cellText: cellText,
+                keys: rows.map(row => columns.map(colIndex => cellText(row, colIndex)).join('\\n').toUpperCase()),
+                texts: {},
+                numbers: {}
+            };
+        }
+
+        function indexColumnText(index, colIndex) {
+            if (!index.texts[colIndex]) {
+                index.texts[colIndex] = index.rows.map(row => index.cellText(row, colIndex).toUpperCase());
+            }
+            return index.texts[colIndex];
+        }
+
+        // Displayed values as numbers, so percentages compare in percent units
+        function indexColumnNumbers(index, colIndex) {
+            if (!index.numbers[colIndex]) {
+                const numbers = new Float64Array(index.rows.length);
+                index.rows.forEach((row, i) => {
+                    numbers[i] = parseFloat(index.cellText(row, colIndex).replace(/[,%🔥]/g, ''));
+                });
+                index.numbers[colIndex] = numbers;
+            }
+            return index.numbers[colIndex];
+        }
+
+        function resolveSearchField(name, columnHeaders, aliases) {
+            const field = name.toLowerCase();
+            if (Object.prototype.hasOwnProperty.call(aliases, field)) return aliases[field];
+            const normalized = columnHeaders.map(header => String(header).toLowerCase().replace(/[^a-z0-9]/g, ''));
+            const exact = normalized.indexOf(field);
+            if (exact > -1) return exact;
+            return normalized.findIndex(header => header.indexOf(field) === 0);
+        }
+
+        // Space-separated terms, all of which must match: plain text matches any
+        // searchable cell; field:text matches inside one column; field>n, field<n,
+        // field>=n, field<=n, field=n and field!=n compare one column as numbers.
+        // Quotes keep spaces in a term: version:"team of the week".
+        function parseSearchQuery(query, index, columnHeaders, aliases) {
+            const terms = query.match(/(?:[^\\s"]+|"[^"]*")+/g) || [];
+            return terms.map(term => {
+                const typed = term.match(/^([a-z0-9]+)(>=|<=|!=|>|<|=|:)(.+)$/i);
+                const colIndex = typed ? resolveSearchField(typed[1], columnHeaders, aliases) : -1;
+                if (colIndex < 0) {
+                    const text = term.replace(/"/g, '').toUpperCase();
+                    return i => index.keys[i].indexOf(text) > -1;
+                }
+                const op = typed[2];
+                const value = typed[3].replace(/"/g, '');
+                const number = parseFloat(value.replace(/[,%]/g, ''));
+                if (op === ':' || isNaN(number)) {
+                    const texts = indexColumnText(index, colIndex);
+                    const text = value.toUpperCase();
+                    if (op === '=') return i => texts[i] === text;
+                    if (op === '!=') return i => texts[i] !== text;
+                    return i => texts[i].indexOf(text) > -1;
                 }
-                
-                valA = String(valA).toLowerCase();
-                valB = String(valB).toLowerCase();
-                if (valA < valB) return chemSortDirection === 'asc' ? -1 : 1;
-                if (valA > valB) return chemSortDirection === 'asc' ? 1 : -1;
-                return 0;
+                const numbers = indexColumnNumbers(index, colIndex);
+                if (op === '>') return i => numbers[i] > number;
+                if (op === '<') return i => numbers[i] < number;
+                if (op === '>=') return i => numbers[i] >= number;
+                if (op === '<=') return i => numbers[i] <= number;
+                if (op === '!=') return i => numbers[i] !== number;
+                return i => numbers[i] === number;
             });
-            
-            renderChemTable();
         }
 
-        function renderTable() {
-            const headerRow = document.getElementById('tableHeader');
-            const tableBody = document.getElementById('tableBody');
-            headerRow.innerHTML = '';
-            tableBody.innerHTML = '';
+        function searchRows(index, order, query, columnHeaders, aliases) {
+            if (!query.trim()) return order;
+            const predicates = parseSearchQuery(query, index, columnHeaders, aliases);
+            return order.filter(i => predicates.every(predicate => predicate(i)));
+        }
+
+        // ==================== TABLE ENGINE ====================
+        // Sort keys, search indexes and filtering run in a Web Worker built from an
+        // inline Blob of the functions in TABLE_ENGINE_FUNCTIONS, which holds its own
+        // copy of each table. The page posts rows once per load and gets back each view
+        // as a transferred Uint32Array, leaving it only rendering and input. Where a
+        // worker cannot be created, or fails, the same functions run on this thread.
+
+        function tableEngineConfig(table) {
+            if (table === 'chem') {
+                return { cellText: chemCellText, stripPattern: /[,%]/g, aliases: CHEM_SEARCH_FIELDS };
+            }
+            return { cellText: dashboardCellText, stripPattern: /[,%🔥]/g, aliases: DASHBOARD_SEARCH_FIELDS };
+        }
+
+        // Applies one message to the engine's tables; view requests return the reply
+        function handleTableMessage(tables, message) {
+            const table = message.table;
+            if (message.type === 'load') {
+                const config = tableEngineConfig(table);
+                tables[table] = {
+                    rows: message.rows,
+                    headers: message.headers,
+                    columns: message.columns,
+                    config: config,
+                    sortKeys: createSortKeys(message.rows, config.stripPattern),
+                    searchIndex: null
+                };
+                return null;
+            }
             
-            // FIXED: Identify percentage columns for formatting
-            const percentageColumns = [7, 8, 9, 19]; // % From Low Point, % From Hist Low (7D), % From 14D Low, Net Profit %
+            const state = tables[table];
+            if (!state) return null;
             
-            visibleColumns.forEach(colIndex => {
-                const th = document.createElement('th');
-                th.textContent = headers[colIndex];
-                th.onclick = () => sortTable(colIndex);
-                if (sortColumn === colIndex) {
-                    th.className = sortDirection === 'asc' ? 'sorted-asc' : 'sorted-desc';
-                }
-                headerRow.appendChild(th);
-            });
+            if (message.type === 'columns') {
+                state.columns = message.columns;
+                state.searchIndex = null;
+                return null;
+            }
             
-            dashboardData.forEach(row => {
-                const tr = document.createElement('tr');
-                visibleColumns.forEach(colIndex => {
-                    const td = document.createElement('td');
-                    let value = row[colIndex];
-                    
-                    // FIXED: Apply percentage formatting to percentage columns
-                    if (percentageColumns.includes(colIndex)) {
-                        value = formatPercentage(value);
+            if (message.type === 'setRows') {
+                message.indexes.forEach((rowIndex, i) => {
+                    state.rows[rowIndex] = message.rows[i];
+                });
+                state.sortKeys = createSortKeys(state.rows, state.config.stripPattern);
+                state.searchIndex = null;
+                return null;
+            }
+            
+            if (message.type === 'setCells') {
+                const columnIndexes = [];
+                message.values.forEach((values, i) => {
+                    for (let j = 0; j < values.length; j++) {
+                        state.rows[i][message.colStart + j] = values[j];
+                        if (i === 0) columnIndexes.push(message.colStart + j);
                     }
-                    
-                    td.textContent = value === 0 || value === '' ? '' : value;
-                    tr.appendChild(td);
                 });
-                tableBody.appendChild(tr);
-            });
+                dropSortColumns(state.sortKeys, columnIndexes);
+                state.searchIndex = null;
+                return null;
+            }
+            
+            // 'view'
+            const order = sortedRowOrder(state.sortKeys, message.sortColumn, message.direction);
+            if (message.query.trim() && !state.searchIndex) {
+                state.searchIndex = buildSearchIndex(state.rows, state.columns, state.config.cellText);
+            }
+            const view = searchRows(state.searchIndex, order, message.query, state.headers, state.config.aliases);
+            // Cached orders stay with the engine; replies get their own buffer
+            return { table: table, id: message.id, view: view === order ? order.slice() : view };
         }
 
-        function renderChemTable() {
+        const TABLE_ENGINE_FUNCTIONS = [
+            formatPercentage, dashboardCellText, chemCellText, tableEngineConfig, handleTableMessage,
+            createSortKeys, dropSortColumns, indexSortColumn, sortedRowOrder,
+            buildSearchIndex, indexColumnText, indexColumnNumbers, resolveSearchField, parseSearchQuery, searchRows
+        ];
+
+        const tableEngine = {
+            worker: null,
+            tables: {},
+            nextId: 0,
+            latest: {}
+        };
+
+        function startTableEngine() {
+            if (typeof Worker === 'undefined' || typeof Blob === 'undefined' || typeof URL === 'undefined') return;
+            try {
+                const source = [
+                    'const PERCENTAGE_COLUMNS = ' + JSON.stringify(PERCENTAGE_COLUMNS) + ';',
+                    'const DASHBOARD_SEARCH_FIELDS = ' + JSON.stringify(DASHBOARD_SEARCH_FIELDS) + ';',
+                    'const CHEM_SEARCH_FIELDS = ' + JSON.stringify(CHEM_SEARCH_FIELDS) + ';'
+                ].concat(TABLE_ENGINE_FUNCTIONS.map(fn => fn.toString())).concat([
+                    'const tables = {};',
+                    'self.onmessage = function(e) {',
+                    '    const reply = handleTableMessage(tables, e.data);',
+                    '    if (reply) self.postMessage(reply, [reply.view.buffer]);',
+                    '};'
+                ]).join('\\n');
+                const url = URL.createObjectURL(new Blob([source], { type: 'text/javascript' }));
+                const worker = new Worker(url);
+                URL.revokeObjectURL(url);
+                worker.onmessage = e => receiveTableView(e.data);
+                worker.onerror = e => {
+                    e.preventDefault();
+                    stopTableWorker();
+                };
+                tableEngine.worker = worker;
+            } catch (e) {
+                tableEngine.worker = null;
+            }
+        }
+
+        // Falls back to this thread, reloading the tables the worker held
+        function stopTableWorker() {
+            if (!tableEngine.worker) return;
+            tableEngine.worker.terminate();
+            tableEngine.worker = null;
+            tableEngine.tables = {};
+            if (tableEngine.latest.dashboard) {
+                postDashboardRows();
+                updateDashboardView();
+            }
+            if (tableEngine.latest.chem) {
+                postChemRows();
+                updateChemView();
+            }
+        }
+
+        function postTableMessage(message) {
+            if (tableEngine.worker) {
+                tableEngine.worker.postMessage(message);
+                return;
+            }
+            const reply = handleTableMessage(tableEngine.tables, message);
+            if (reply) receiveTableView(reply);
+        }
+
+        // A view indexes the rows it was computed from, so new rows start from an empty
+        // view until the engine replies; otherwise a scroll in between would draw
+        // indexes past the new data
+        function postDashboardRows() {
+            dashboardView = [];
+            if (currentView === 'fluctuations') renderTable();
+            postTableMessage({ type: 'load', table: 'dashboard', rows: dashboardData, headers: headers, columns: visibleColumns });
+        }
+
+        // The current view still fits the rows; redraw it now so the table's cell
+        // count matches visibleColumns before the next scroll
+        function postDashboardColumns() {
+            if (currentView === 'fluctuations') renderTable();
+            postTableMessage({ type: 'columns', table: 'dashboard', columns: visibleColumns });
+        }
+
+        function postChemRows() {
+            chemView = [];
+            if (currentView !== 'fluctuations') renderChemTable();
+            const columns = [];
+            for (let j = 0; j < CHEM_VISIBLE_COLUMNS && j < chemHeaders.length; j++) columns.push(j);
+            postTableMessage({ type: 'load', table: 'chem', rows: chemData, headers: chemHeaders, columns: columns });
+        }
+
+        function requestTableView(table, sortedColumn, direction, query) {
+            const id = ++tableEngine.nextId;
+            tableEngine.latest[table] = id;
+            postTableMessage({ type: 'view', table: table, id: id, sortColumn: sortedColumn, direction: direction, query: query });
+        }
+
+        // Replies overtaken by a newer request, or for the other tab, are dropped
+        function receiveTableView(reply) {
+            if (reply.id !== tableEngine.latest[reply.table]) return;
+            if (reply.table === 'dashboard') {
+                dashboardView = reply.view;
+                if (currentView === 'fluctuations') renderTable();
+            } else {
+                chemView = reply.view;
+                if (currentView !== 'fluctuations') renderChemTable();
+            }
+        }
+
+        function renderHeader(labels, columnIndexes, sortedColumn, direction, onSort) {
             const headerRow = document.getElementById('tableHeader');
-            const tableBody = document.getElementById('tableBody');
             headerRow.innerHTML = '';
-            tableBody.innerHTML = '';
-            
-            chemHeaders.forEach((header, index) => {
-                if (index >= 9) return;
+            columnIndexes.forEach((colIndex, k) => {
                 const th = document.createElement('th');
-                th.textContent = header;
-                th.onclick = () => sortChemTable(index);
-                if (chemSortColumn === index) {
-                    th.className = chemSortDirection === 'asc' ? 'sorted-asc' : 'sorted-desc';
+                th.textContent = labels[k];
+                th.onclick = () => onSort(colIndex);
+                if (sortedColumn === colIndex) {
+                    th.className = direction === 'asc' ? 'sorted-asc' : 'sorted-desc';
                 }
                 headerRow.appendChild(th);
             });
-            
-            chemData.forEach(row => {
-                const tr = document.createElement('tr');
-                row.forEach((value, index) => {
-                    if (index >= 9) return;
-                    const td = document.createElement('td');
-                    if (index === 0) {
+        }
+
+        function renderTable() {
+            renderHeader(visibleColumns.map(colIndex => headers[colIndex]), visibleColumns, sortColumn, sortDirection, sortTable);
+            setVirtualRows('dashboard', dashboardView.length, visibleColumns.length, function(tr, viewIndex) {
+                const row = dashboardData[dashboardView[viewIndex]];
+                const cells = tr.children;
+                for (let j = 0; j < visibleColumns.length; j++) {
+                    cells[j].textContent = dashboardCellText(row, visibleColumns[j]);
+                }
+            });
+        }
+
+        function renderChemTable() {
+            const columnIndexes = [];
+            for (let j = 0; j < CHEM_VISIBLE_COLUMNS && j < chemHeaders.length; j++) columnIndexes.push(j);
+            renderHeader(chemHeaders.slice(0, columnIndexes.length), columnIndexes, chemSortColumn, chemSortDirection, sortChemTable);
+            setVirtualRows('chem', chemView.length, columnIndexes.length, function(tr, viewIndex) {
+                const row = chemData[chemView[viewIndex]];
+                const cells = tr.children;
+                for (let j = 0; j < columnIndexes.length; j++) {
+                    const td = cells[j];
+                    td.textContent = chemCellText(row, j);
+                    if (j === 0) {
                         td.className = 'player-name-cell';
-                        td.textContent = value;
-                        td.onclick = (e) => showContextMenu(e, value, row[7], row[8]);
-                    } else {
-                        td.textContent = value === 0 || value === '' ? '' : value;
+                        td.onclick = (e) => showContextMenu(e, row[0], row[7], row[8]);
                     }
-                    tr.appendChild(td);
-                });
-                tableBody.appendChild(tr);
+                }
             });
         }
 
+        // Windowed table body: only the rows in view plus VIRTUAL_OVERSCAN either side
+        // are in the DOM, between two spacer rows that stand in for the rest. Row
+        // elements are recycled while scrolling and refilled through fillRow.
+        const VIRTUAL_OVERSCAN = 10;
+        const virtualTable = {
+            rowHeight: 41,
+            owner: null,
+            rowCount: 0,
+            cellCount: -1,
+            fillRow: null,
+            rows: [],
+            first: -1,
+            last: -1,
+            topSpacer: null,
+            bottomSpacer: null,
+            drawPending: false
+        };
+
+        function createSpacerRow() {
+            const tr = document.createElement('tr');
+            tr.className = 'virtual-spacer';
+            tr.appendChild(document.createElement('td'));
+            return tr;
+        }
+
+        function setVirtualRows(owner, rowCount, cellCount, fillRow) {
+            const tableBody = document.getElementById('tableBody');
+            // Row elements are rebuilt only when the table or its column count changes
+            if (owner !== virtualTable.owner || cellCount !== virtualTable.cellCount ||
+                    !virtualTable.topSpacer || virtualTable.topSpacer.parentNode !== tableBody) {
+                if (owner !== virtualTable.owner) {
+                    document.getElementById('tableContainer').scrollTop = 0;
+                }
+                tableBody.innerHTML = '';
+                virtualTable.rows = [];
+                virtualTable.topSpacer = createSpacerRow();
+                virtualTable.bottomSpacer = createSpacerRow();
+                tableBody.appendChild(virtualTable.topSpacer);
+                tableBody.appendChild(virtualTable.bottomSpacer);
+            }
+            virtualTable.topSpacer.firstChild.colSpan = Math.max(cellCount, 1);
+            virtualTable.bottomSpacer.firstChild.colSpan = Math.max(cellCount, 1);
+            virtualTable.owner = owner;
+            virtualTable.rowCount = rowCount;
+            virtualTable.cellCount = cellCount;
+            virtualTable.fillRow = fillRow;
+            virtualTable.first = -1;
+            drawVirtualRows();
+        }
+
+        function drawVirtualRows() {
+            virtualTable.drawPending = false;
+            // A scroll can arrive before the first table has been set up
+            if (!virtualTable.topSpacer) return;
+            const container = document.getElementById('tableContainer');
+            const tableBody = document.getElementById('tableBody');
+            const rowHeight = virtualTable.rowHeight;
+            const windowSize = Math.ceil(container.clientHeight / rowHeight) + 2 * VIRTUAL_OVERSCAN;
+            const first = Math.max(0, Math.min(Math.floor(container.scrollTop / rowHeight) - VIRTUAL_OVERSCAN, virtualTable.rowCount - windowSize));
+            const last = Math.min(virtualTable.rowCount, first + windowSize);
+            if (first === virtualTable.first && last === virtualTable.last) return;
+            virtualTable.first = first;
+            virtualTable.last = last;
+            
+            const needed = last - first;
+            while (virtualTable.rows.length < needed) {
+                const tr = document.createElement('tr');
+                for (let j = 0; j < virtualTable.cellCount; j++) {
+                    tr.appendChild(document.createElement('td'));
+                }
+                tableBody.insertBefore(tr, virtualTable.bottomSpacer);
+                virtualTable.rows.push(tr);
+            }
+            for (let k = 0; k < virtualTable.rows.length; k++) {
+                const tr = virtualTable.rows[k];
+                if (k < needed) {
+                    tr.style.display = '';
+                    virtualTable.fillRow(tr, first + k);
+                } else {
+                    tr.style.display = 'none';
+                }
+            }
+            virtualTable.topSpacer.firstChild.style.height = (first * rowHeight) + 'px';
+            virtualTable.bottomSpacer.firstChild.style.height = ((virtualTable.rowCount - last) * rowHeight) + 'px';
+            
+            // Spacer sizes follow the real row height once a row has been laid out
+            if (needed > 0) {
+                const measured = virtualTable.rows[0].offsetHeight;
+                if (measured > 0 && Math.abs(measured - rowHeight) > 1) {
+                    virtualTable.rowHeight = measured;
+                    virtualTable.first = -1;
+                    drawVirtualRows();
+                }
+            }
+        }
+
+        document.getElementById('tableContainer').addEventListener('scroll', function() {
+            if (virtualTable.drawPending) return;
+            virtualTable.drawPending = true;
+            requestAnimationFrame(drawVirtualRows);
+        });
+
         function showContextMenu(event, playerName, priceHunter, priceShadow) {
             event.preventDefault();
             event.stopPropagation();
@@ -1645,58 +4392,111 @@ function getHtmlOutput() {
             document.getElementById('contextMenu').classList.add('hidden');
         });
 
+        let searchTimer = null;
+        let chemSearchTimer = null;
+
         function filterTable() {
-            const input = document.getElementById('searchBox');
-            const filter = input.value.toUpperCase();
-            const table = document.getElementById('dashboardTable');
-            const tr = table.getElementsByTagName('tr');
-            
-            for (let i = 1; i < tr.length; i++) {
-                let found = false;
-                const td = tr[i].getElementsByTagName('td');
-                for (let j = 0; j < td.length; j++) {
-                    if (td[j]) {
-                        const txtValue = td[j].textContent || td[j].innerText;
-                        if (txtValue.toUpperCase().indexOf(filter) > -1) {
-                            found = true;
-                            break;
-                        }
-                    }
-                }
-                tr[i].style.display = found ? '' : 'none';
-            }
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(updateDashboardView, SEARCH_DEBOUNCE_MS);
         }
 
         function filterChemTable() {
-            const input = document.getElementById('chemSearchBox');
-            const filter = input.value.toUpperCase();
-            const table = document.getElementById('dashboardTable');
-            const tr = table.getElementsByTagName('tr');
-            
-            for (let i = 1; i < tr.length; i++) {
-                let found = false;
-                const td = tr[i].getElementsByTagName('td');
-                for (let j = 0; j < td.length; j++) {
-                    if (td[j]) {
-                        const txtValue = td[j].textContent || td[j].innerText;
-                        if (txtValue.toUpperCase().indexOf(filter) > -1) {
-                            found = true;
-                            break;
-                        }
-                    }
-                }
-                tr[i].style.display = found ? '' : 'none';
-            }
+            clearTimeout(chemSearchTimer);
+            chemSearchTimer = setTimeout(updateChemView, SEARCH_DEBOUNCE_MS);
         }
 
+        // Parallel google.script.run calls used for a rebuild
+        const BUILD_SHARDS = 4;
+
+        // Every build stores all four modes, so switching applies the stored
+        // targets locally and only persists the choice in the background
         function buildDashboard(mode) {
+            if (!modeTargets || !modeTargets[mode] || modeTargets[mode].length !== dashboardData.length) {
+                rebuildDashboard(mode);
+                return;
+            }
+            const targetCol = headers.indexOf('Target Buy');
+            dashboardData.forEach((row, i) => {
+                const targets = modeTargets[mode][i];
+                for (let j = 0; j < targets.length; j++) {
+                    row[targetCol + j] = targets[j];
+                }
+            });
+            activeMode = mode;
+            postTableMessage({ type: 'setCells', table: 'dashboard', colStart: targetCol, values: modeTargets[mode] });
+            updateDashboardView();
+            showStatus('Switched to ' + mode + ' mode');
+            google.script.run
+                .withSuccessHandler(function(result) {
+                    if (!result.success) {
+                        showStatus(result.message, true);
+                    }
+                })
+                .withFailureHandler(function(error) {
+                    showStatus('Error saving mode: ' + error.message, true);
+                })
+                .setDashboardMode(mode);
+        }
+
+        // Prices the watchlist in parallel shards, then writes the merged rows once
+        function rebuildDashboard(mode) {
+            mode = mode || activeMode;
             showStatus('Building dashboard in ' + mode + ' mode...');
-            const functionMap = {
-                'normal': 'buildDashboardNormal',
-                'crash': 'buildDashboardCrash',
-                'rise': 'buildDashboardRise',
-                'investments': 'buildDashboardInvestments'
+            google.script.run
+                .withSuccessHandler(function(plan) {
+                    if (!plan.success) {
+                        showStatus(plan.message, true);
+                        return;
+                    }
+                    if (plan.upToDate) {
+                        showStatus(plan.message);
+                        loadDashboard();
+                        return;
+                    }
+                    runBuildShards(mode, plan);
+                })
+                .withFailureHandler(function(error) {
+                    showStatus('Error: ' + error.message, true);
+                })
+                .getDashboardShardPlan(mode, BUILD_SHARDS);
+        }
+
+        function runBuildShards(mode, plan) {
+            const results = new Array(plan.shards.length);
+            let remaining = plan.shards.length;
+            let failed = false;
+            const fail = function(message) {
+                if (failed) return;
+                failed = true;
+                showStatus(message, true);
             };
+            plan.shards.forEach(function(shard, k) {
+                google.script.run
+                    .withSuccessHandler(function(result) {
+                        if (!result.success) {
+                            fail(result.message);
+                            return;
+                        }
+                        results[k] = result;
+                        remaining--;
+                        if (remaining === 0 && !failed) {
+                            commitBuildShards(mode, plan, results);
+                        }
+                    })
+                    .withFailureHandler(function(error) {
+                        fail('Error: ' + error.message);
+                    })
+                    .buildDashboardShard(mode, shard[0], shard[1], plan.today, plan.fingerprint);
+            });
+        }
+
+        function commitBuildShards(mode, plan, results) {
+            let rows = [];
+            let modeRows = [];
+            results.forEach(function(result) {
+                rows = rows.concat(result.dashboardRows);
+                modeRows = modeRows.concat(result.modeRows);
+            });
             google.script.run
                 .withSuccessHandler(function(result) {
                     if (result.success) {
@@ -1709,7 +4509,7 @@ function getHtmlOutput() {
                 .withFailureHandler(function(error) {
                     showStatus('Error: ' + error.message, true);
                 })
-                [functionMap[mode]]();
+                .commitDashboardShards(mode, plan.fingerprint, rows, modeRows);
         }
 
         function logData() {
@@ -1761,7 +4561,10 @@ function getHtmlOutput() {
                 .logChemStylesData();
         }
 
-        window.onload = loadDashboard;
+        window.onload = function() {
+            startTableEngine();
+            loadDashboard();
+        };
     </script>
 </body>
 </html>`;
@@ -1779,7 +4582,14 @@ function onOpen() {
       .addItem('Build Dashboard (Crash Mode)', 'buildDashboardCrash')
       .addItem('Build Dashboard (Rise Mode)', 'buildDashboardRise')
       .addItem('Build Dashboard (Investments Mode)', 'buildDashboardInvestments')
-      .addItem('Log Manual Data to Archive', 'menuLogManualData'))
+      .addItem('Recompute Edited Players', 'menuRecomputeDirtyPlayers')
+      .addItem('Track Manual Data Edits', 'menuInstallDirtyRowTrigger')
+      .addItem('Schedule Background Refresh', 'menuInstallSnapshotTrigger')
+      .addItem('Stop Background Refresh', 'menuRemoveSnapshotTrigger')
+      .addItem('Log Manual Data to Archive', 'menuLogManualData')
+      .addItem('Rebuild Daily Rollup', 'menuRebuildDailyRollup')
+      .addItem('Migrate Archives to Numeric', 'menuMigrateArchivesToNumeric')
+      .addItem('Run Archive Maintenance', 'menuMaintainArchives'))
     .addSubMenu(ui.createMenu('⚗️ Chem Styles')
       .addItem('Build Chem Styles Dashboard', 'menuBuildChemDashboard')
       .addItem('Log Chem Styles to Archive', 'menuLogChemData'))
@@ -1815,3 +4625,61 @@ function menuLogChemData() {
     ui.alert('Error', result.message, ui.ButtonSet.OK);
   }
 }
+
+function menuRebuildDailyRollup() {
+  const result = rebuildDailyRollup();
+  const ui = SpreadsheetApp.getUi();
+  if (result.success) {
+    ui.alert('Success', result.message, ui.ButtonSet.OK);
+  } else {
+    ui.alert('Error', result.message, ui.ButtonSet.OK);
+  }
+}
+
+function menuMigrateArchivesToNumeric() {
+  const result = migrateArchivesToNumeric();
+  const ui = SpreadsheetApp.getUi();
+  if (result.success) {
+    ui.alert('Success', result.message, ui.ButtonSet.OK);
+  } else {
+    ui.alert('Error', result.message, ui.ButtonSet.OK);
+  }
+}
+
+function menuMaintainArchives() {
+  const result = maintainArchives();
+  const ui = SpreadsheetApp.getUi();
+  if (result.success) {
+    ui.alert('Success', result.message, ui.ButtonSet.OK);
+  } else {
+    ui.alert('Error', result.message, ui.ButtonSet.OK);
+  }
+}
+
+function menuRecomputeDirtyPlayers() {
+  const result = recomputeDirtyPlayers();
+  const ui = SpreadsheetApp.getUi();
+  if (result.success) {
+    ui.alert('Success', result.message, ui.ButtonSet.OK);
+  } else {
+    ui.alert('Error', result.message, ui.ButtonSet.OK);
+  }
+}
+
+function menuInstallDirtyRowTrigger() {
+  const result = installDirtyRowTrigger();
+  const ui = SpreadsheetApp.getUi();
+  ui.alert('Success', result.message, ui.ButtonSet.OK);
+}
+
+function menuInstallSnapshotTrigger() {
+  const result = installSnapshotTrigger();
+  const ui = SpreadsheetApp.getUi();
+  ui.alert('Success', result.message, ui.ButtonSet.OK);
+}
+
+function menuRemoveSnapshotTrigger() {
+  const result = removeSnapshotTrigger();
+  const ui = SpreadsheetApp.getUi();
+  ui.alert('Success', result.message, ui.ButtonSet.OK);
+}